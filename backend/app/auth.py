@@ -1,45 +1,71 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import Any, Awaitable, Callable, Dict
 
 import base64
+from hashlib import blake2b
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
-from .config import SaraswatiSettings, get_settings
+from .config import SaraswatiSettings
+from .dependencies import get_app_settings
 from .auth_external import login_external, introspect_external
 from .auth_native import login_native, register_native, introspect_native
 
 _security = HTTPBearer(auto_error=False)
 
+# Recently rejected Basic credentials (keyed by a digest of "username:password") so repeated
+# failures are answered without another login round-trip. Only genuine rejections (401) are
+# cached, never provider errors, and registering clears the entry for those credentials.
+_failed_basic: TTLCache[bytes, bool] = TTLCache(maxsize=1024, ttl=30)
+_BASIC_PREFIX_LEN = len("Basic ")
+
+
+# Per-mode dispatch tables, built once at import. `decode` mode doesn't support server-side
+# login, so it defaults to native login for local users.
+_LOGIN: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+    "elastic": login_native,
+    "introspect": login_external,
+    "decode": login_native,
+}
+_REGISTER: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+    "elastic": register_native,
+    "decode": register_native,
+}
+_INTROSPECT: Dict[str, Callable[..., Awaitable[Dict[str, Any]]]] = {
+    "elastic": introspect_native,
+    "decode": introspect_native,
+    "introspect": introspect_external,
+}
+
 
 async def login(username: str, password: str, settings: SaraswatiSettings) -> Dict[str, Any]:
-    mode = settings.auth_system
-    if mode == "elastic":
-        return await login_native(username, password, settings)
-    if mode == "introspect":
-        return await login_external(username, password, settings)
-    if mode == "decode":
-        # decode mode doesn't support server-side login; default to native for local users
-        return await login_native(username, password, settings)
-    raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unsupported auth mode")
+    fn = _LOGIN.get(settings.auth_system)
+    if fn is None:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unsupported auth mode")
+    return await fn(username, password, settings)
+
+
+def _basic_failure_key(username: str, password: str) -> bytes:
+    return blake2b(f"{username}:{password}".encode("utf-8"), digest_size=16).digest()
 
 
 async def register(username: str, password: str, name: str | None, settings: SaraswatiSettings) -> Dict[str, Any]:
-    mode = settings.auth_system
-    if mode in ("elastic", "decode"):
-        return await register_native(username, password, name, settings)
-    raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Registration disabled")
+    fn = _REGISTER.get(settings.auth_system)
+    if fn is None:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Registration disabled")
+    result = await fn(username, password, name, settings)
+    _failed_basic.pop(_basic_failure_key(username, password), None)
+    return result
 
 
 async def introspect_token(token: str, settings: SaraswatiSettings) -> Dict[str, Any]:
-    mode = settings.auth_system
-    if mode == "elastic" or mode == "decode":
-        return await introspect_native(token, settings)
-    if mode == "introspect":
-        return await introspect_external(token, settings)
-    raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unsupported auth mode")
+    fn = _INTROSPECT.get(settings.auth_system)
+    if fn is None:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Unsupported auth mode")
+    return await fn(token, settings)
 
 
 def _normalize_claims(claims: Dict[str, Any]) -> Dict[str, Any]:
@@ -76,7 +102,7 @@ def _normalize_claims(claims: Dict[str, Any]) -> Dict[str, Any]:
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials | None = Depends(_security),
-    settings: SaraswatiSettings = Depends(get_settings),
+    settings: SaraswatiSettings = Depends(get_app_settings),
     request: Request = None,
 ) -> Dict[str, Any]:
     if credentials is None:
@@ -89,11 +115,17 @@ async def get_current_user(
 
         if auth_header and auth_header.lower().startswith("basic "):
             try:
-                b64 = auth_header.split(None, 1)[1]
-                decoded = base64.b64decode(b64).decode("utf-8")
-                username, password = decoded.split(":", 1)
+                decoded = base64.b64decode(auth_header[_BASIC_PREFIX_LEN:].strip()).decode("utf-8")
             except Exception:
                 raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid Basic auth header")
+            sep = decoded.find(":")
+            if sep < 0:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid Basic auth header")
+            username, password = decoded[:sep], decoded[sep + 1:]
+
+            failure_key = _basic_failure_key(username, password)
+            if failure_key in _failed_basic:
+                raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
             # Use existing login flow (which will proxy to external provider or
             # perform native login depending on `auth_system`). Expect a dict
@@ -101,7 +133,10 @@ async def get_current_user(
             try:
                 login_resp = await login(username, password, settings)
             except HTTPException as exc:
-                # preserve 401/403 semantics
+                if exc.status_code != status.HTTP_401_UNAUTHORIZED:
+                    # provider/config errors aren't a verdict on these credentials; surface them as-is
+                    raise
+                _failed_basic[failure_key] = True
                 raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials") from exc
 
             token = login_resp.get("access_token")
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+def normalize_user(src: Dict[str, Any], fallback_username: str) -> Dict[str, Any]:
+    """Build the `{id, username, name, roles}` user shape returned by login flows."""
+    user_id = src.get("id")
+    username = src.get("username") or user_id or fallback_username
+    return {
+        "id": user_id or username,
+        "username": username,
+        "name": src.get("name") or username,
+        "roles": src.get("roles") or src.get("role") or [],
+    }
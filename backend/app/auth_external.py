@@ -1,20 +1,57 @@
 from __future__ import annotations
 
+from hashlib import blake2b
 from typing import Any, Dict
 
+import asyncio
 import time
-import threading
 
 import httpx
+import jwt
+import orjson
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 
+from .auth_common import normalize_user
 from .config import SaraswatiSettings
 
 
-# Simple in-memory cache (module-level so it's shared across calls in the same process).
-# Maps token -> (expiry_timestamp, data)
-_cache: Dict[str, tuple[float, Dict[str, Any]]] = {}
-_cache_lock = threading.Lock()
+# Bounded in-memory cache (module-level so it's shared across calls in the same process).
+# Maps blake2b(token) -> (expiry_timestamp, data); raw tokens are never kept in memory.
+# Only touched from the event loop thread with no await in between, so it needs no lock.
+_cache: TTLCache[bytes, tuple[float, Dict[str, Any]]] = TTLCache(maxsize=10_000, ttl=3600)
+
+# Introspections currently in flight, so concurrent requests for one token share a single POST.
+# Each runs as its own task, so no single caller's cancellation can cancel it for the others.
+_inflight: Dict[bytes, asyncio.Task[Dict[str, Any]]] = {}
+
+# Long-lived HTTP client so login/introspection calls reuse pooled keep-alive connections.
+_client: httpx.AsyncClient | None = None
+_JSON_HEADERS = {"content-type": "application/json"}
+# Provider responses to a login attempt that mean "wrong credentials" rather than an outage.
+_REJECTED_LOGIN_STATUSES = frozenset({400, 401, 403})
+
+# JWKS client (caches the provider's signing keys) used to verify JWTs locally.
+_jwks_client: jwt.PyJWKClient | None = None
+
+
+def get_client(settings: SaraswatiSettings) -> httpx.AsyncClient:
+    """Return the shared client for the external auth service, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=str(settings.auth_external.service),
+            timeout=10,
+            limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
 
 
 async def login_external(username: str, password: str, settings: SaraswatiSettings) -> Dict[str, Any]:
@@ -22,67 +59,151 @@ async def login_external(username: str, password: str, settings: SaraswatiSettin
     if not settings.auth_external.service:
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="External auth service not configured")
 
-    async with httpx.AsyncClient(base_url=str(settings.auth_external.service), timeout=10) as client:
-        response = await client.post(settings.auth_external.login_path, json={"username": username, "password": password})
-
-    if response.status_code >= 400:
+    client = get_client(settings)
+    try:
+        response = await client.post(
+            settings.auth_external.login_path,
+            content=orjson.dumps({"username": username, "password": password}),
+            headers=_JSON_HEADERS,
+        )
+    except httpx.HTTPError as exc:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Authentication service unavailable") from exc
+
+    # Only an explicit rejection means bad credentials; anything else is a provider problem
+    if response.status_code in _REJECTED_LOGIN_STATUSES:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if response.status_code >= 400:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Authentication service unavailable")
 
-    data = response.json()
+    data = orjson.loads(response.content)
     token = data.get("access_token") or data.get("token")
     auth_ok = data.get("auth", True)
     if not token or not auth_ok:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
-    user_info: Dict[str, Any] = data.get("user") or {}
-    username_norm = user_info.get("username") or user_info.get("id") or username
-    normalized_user = {
-        "id": user_info.get("id") or username_norm,
-        "username": username_norm,
-        "name": user_info.get("name") or username_norm,
-        "roles": user_info.get("roles") or user_info.get("role") or [],
-    }
+    normalized_user = normalize_user(data.get("user") or {}, username)
 
     return {"access_token": token, "user": normalized_user}
 
 
-async def introspect_external(token: str, settings: SaraswatiSettings) -> Dict[str, Any]:
-    if not settings.auth_external.service:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="External auth service not configured")
+def _get_jwks_client(jwks_uri: str) -> jwt.PyJWKClient:
+    global _jwks_client
+    if _jwks_client is None or _jwks_client.uri != jwks_uri:
+        _jwks_client = jwt.PyJWKClient(jwks_uri, cache_keys=True)
+    return _jwks_client
 
-    # Simple in-memory TTL cache keyed by token. We only cache successful/active responses.
-    # Cache is process-local (no persistence) and protected by a lock for thread-safety.
-    path = settings.auth_external.introspect_path or "/introspect"
-    cache_ttl = int(settings.auth_external.cache_ttl_seconds or 0)
 
-    # Check cache first
-    with _cache_lock:
-        entry = _cache.get(token)
-        if entry:
-            expiry, cached = entry
-            if expiry > time.time():
-                return cached
-            else:
-                # expired
-                del _cache[token]
-
-    async with httpx.AsyncClient(base_url=str(settings.auth_external.service), timeout=10) as client:
-        response = await client.post(path, json={"token": token, "audience": settings.auth_external.audience})
+def _verify_locally(token: str, settings: SaraswatiSettings) -> Dict[str, Any]:
+    """Verify a JWT against the provider's JWKS; raises on any failure."""
+    cfg = settings.auth_external
+    signing_key = _get_jwks_client(str(cfg.jwks_uri)).get_signing_key_from_jwt(token)
+    claims = jwt.decode(
+        token,
+        signing_key.key,
+        algorithms=[signing_key.algorithm_name],
+        audience=cfg.audience,
+        issuer=cfg.issuer,
+        options={"verify_aud": cfg.audience is not None},
+    )
+    claims["active"] = True
+    return claims
 
-    if response.status_code >= 400:
+
+def _cache_claims(key: bytes, data: Dict[str, Any], cache_ttl: int) -> None:
+    # Cache positive/introspected responses if TTL configured, never past the token's own expiry
+    if cache_ttl and data.get("active"):
+        now = time.time()
+        effective_ttl = cache_ttl
+        exp = data.get("exp")
+        if isinstance(exp, (int, float)):
+            effective_ttl = min(cache_ttl, max(0, int(exp - now)))
+        if effective_ttl > 0:
+            _cache[key] = (now + effective_ttl, data)
+
+
+async def _introspect_remote(token: str, settings: SaraswatiSettings) -> Dict[str, Any]:
+    path = settings.auth_external.introspect_path or "/introspect"
+    client = get_client(settings)
+    try:
+        response = await client.post(
+            path,
+            content=orjson.dumps({"token": token, "audience": settings.auth_external.audience}),
+            headers=_JSON_HEADERS,
+        )
+    except httpx.HTTPError as exc:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Authentication service unavailable") from exc
+
+    # As with login, only an explicit rejection means a bad token; anything else is a provider problem
+    if response.status_code in _REJECTED_LOGIN_STATUSES:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
+    if response.status_code >= 400:
+        raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail="Authentication service unavailable")
 
-    data = response.json()
+    data = orjson.loads(response.content)
     active = data.get("active")
     if active is None:
         active = bool(data.get("auth"))
         data["active"] = active
     if not active:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Token inactive")
-
-    # Cache positive/introspected responses if TTL configured
-    if cache_ttl and data.get("active"):
-        expiry_ts = time.time() + cache_ttl
-        with _cache_lock:
-            _cache[token] = (expiry_ts, data)
     return data
+
+
+async def _introspect_and_cache(key: bytes, token: str, settings: SaraswatiSettings, cache_ttl: int) -> Dict[str, Any]:
+    try:
+        data = await _introspect_remote(token, settings)
+        _cache_claims(key, data, cache_ttl)
+        return data
+    finally:
+        # Leave the in-flight table as the task finishes (a done callback runs a loop turn later),
+        # so a caller arriving after a failure starts a fresh request instead of reusing the error.
+        if _inflight.get(key) is asyncio.current_task():
+            del _inflight[key]
+
+
+def _forget_inflight(key: bytes, task: asyncio.Task[Dict[str, Any]]) -> None:
+    # normally already gone (see _introspect_and_cache); this covers a task cancelled before it ever ran
+    if _inflight.get(key) is task:
+        del _inflight[key]
+    # mark any failure as retrieved so it isn't logged when every waiter has gone away
+    if not task.cancelled():
+        task.exception()
+
+
+async def introspect_external(token: str, settings: SaraswatiSettings) -> Dict[str, Any]:
+    if not settings.auth_external.service:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="External auth service not configured")
+
+    # In-memory TTL cache keyed by a digest of the token. We only cache successful/active responses.
+    # Cache is process-local (no persistence).
+    cache_ttl = int(settings.auth_external.cache_ttl_seconds or 0)
+    key = blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+    # Check cache first
+    entry = _cache.get(key)
+    if entry:
+        expiry, cached = entry
+        if expiry > time.time():
+            return cached
+        # expired
+        _cache.pop(key, None)
+
+    # JWTs signed by a key published in the provider's JWKS are verified locally, skipping the
+    # round-trip; opaque tokens (or ones that fail local checks) fall through to remote introspection.
+    if settings.auth_external.jwks_uri and token.count(".") == 2:
+        try:
+            claims = await asyncio.to_thread(_verify_locally, token, settings)
+        except jwt.PyJWTError:
+            pass
+        else:
+            _cache_claims(key, claims, cache_ttl)
+            return claims
+
+    # Single-flight: the first caller for a token starts the remote call, everyone (the first
+    # caller included) awaits it through a shield, so a cancelled request only stops its own wait.
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.create_task(_introspect_and_cache(key, token, settings, cache_ttl))
+        _inflight[key] = task
+        task.add_done_callback(lambda done: _forget_inflight(key, done))
+    return await asyncio.shield(task)
@@ -1,48 +1,136 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 from datetime import datetime, timedelta, timezone
+from hashlib import blake2b
 from typing import Any, Dict, Optional, cast
 
 import hmac
+import logging
+import os
+import time
+
 import jwt
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+from cachetools import TTLCache
 from fastapi import HTTPException, status
 
+from .auth_common import normalize_user
 from .config import SaraswatiSettings
 from .elasticsearch_client import get_elasticsearch_client
 
+logger = logging.getLogger(__name__)
 
-async def login_native(username: str, password: str, settings: SaraswatiSettings) -> Dict[str, Any]:
-    client = get_elasticsearch_client(settings)
-    index = settings.elasticsearch and settings.elasticsearch.users_index
-    if not index:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Users index not configured")
+# Decoded claims of recently verified tokens, keyed by blake2b(token) -> (expiry_timestamp, payload),
+# so repeat requests with the same bearer token skip signature verification.
+_JWT_CACHE_TTL = 300
+_jwt_cache: TTLCache[bytes, tuple[float, Dict[str, Any]]] = TTLCache(maxsize=50_000, ttl=_JWT_CACHE_TTL)
 
-    # Search for the user
-    body = {"query": {"bool": {"should": [{"term": {"username.keyword": username}}, {"term": {"id.keyword": username}}], "minimum_should_match": 1}}}
-    resp = await client.search(index=index, body=body, size=1)
-    hits = resp.get("hits", {}).get("hits", [])
-    if not hits:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
-    user = hits[0].get("_source") or {}
+_password_hasher = PasswordHasher()
+
+# Users whose credentials were verified recently, keyed by login name -> (password_fingerprint,
+# normalized_user), so immediate re-logins only pay for a keyed blake2b instead of the KDF.
+# The fingerprint key is random per process, so cached fingerprints are useless outside it.
+_FINGERPRINT_KEY = os.urandom(32)
+_verified_logins: TTLCache[str, tuple[bytes, Dict[str, Any]]] = TTLCache(maxsize=10_000, ttl=60)
+
+# Recently fetched user records, keyed by login name -> (doc_id, stored_hash, normalized_user),
+# so repeated logins skip the Elasticsearch lookup.
+_user_cache: TTLCache[str, tuple[Optional[str], str, Dict[str, Any]]] = TTLCache(maxsize=10_000, ttl=60)
 
-    stored_hash = user.get("password_hash")
-    if not stored_hash:
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
 
+def _password_fingerprint(password: str) -> bytes:
+    return blake2b(password.encode("utf-8"), key=_FINGERPRINT_KEY, digest_size=16).digest()
+
+
+def _user_query(username: str) -> Dict[str, Any]:
+    return {"bool": {"should": [{"term": {"username.keyword": username}}, {"term": {"id.keyword": username}}], "minimum_should_match": 1}}
+
+
+def _hash_password(password: str) -> str:
+    return _password_hasher.hash(password)
+
+
+def _is_legacy_hash(stored_hash: str) -> bool:
+    return not stored_hash.startswith("$argon2")
+
+
+def _verify_password(stored_hash: str, password: str) -> bool:
+    if not _is_legacy_hash(stored_hash):
+        try:
+            return _password_hasher.verify(stored_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+    # Accounts registered before argon2 was adopted store an unsalted SHA-256 hex digest
     candidate_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
-    if not hmac.compare_digest(candidate_hash, stored_hash):
-        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    return hmac.compare_digest(candidate_hash, stored_hash)
 
-    username_norm = user.get("username") or user.get("id") or username
-    normalized_user = {"id": user.get("id") or username_norm, "username": username_norm, "name": user.get("name") or username_norm, "roles": user.get("roles") or []}
 
-    # Issue local JWT
+def _issue_token(normalized_user: Dict[str, Any], settings: SaraswatiSettings) -> str:
     ttl = settings.auth_native.cache_ttl_seconds or 3600
     expires = int((datetime.now(timezone.utc) + timedelta(seconds=ttl)).timestamp())
     claims = {"sub": normalized_user["id"], "username": normalized_user["username"], "name": normalized_user["name"], "roles": normalized_user["roles"], "exp": expires, "aud": settings.auth_native.audience}
-    token = jwt.encode(claims, settings.auth_native.jwt_secret, algorithm=settings.auth_native.jwt_algorithm)
-    return {"access_token": cast(str, token), "user": normalized_user}
+    return cast(str, jwt.encode(claims, settings.auth_native.jwt_secret_bytes, algorithm=settings.auth_native.jwt_algorithm))
+
+
+async def login_native(username: str, password: str, settings: SaraswatiSettings) -> Dict[str, Any]:
+    fingerprint = _password_fingerprint(password)
+    cached_login = _verified_logins.get(username)
+    if cached_login is not None and hmac.compare_digest(cached_login[0], fingerprint):
+        cached_user = dict(cached_login[1])
+        return {"access_token": _issue_token(cached_user, settings), "user": cached_user}
+
+    cached_record = _user_cache.get(username)
+    if cached_record is not None:
+        doc_id, stored_hash, normalized_user = cached_record
+    else:
+        client = get_elasticsearch_client(settings)
+        index = settings.elasticsearch and settings.elasticsearch.users_index
+        if not index:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Users index not configured")
+
+        # Search for the user
+        resp = await client.search(index=index, query=_user_query(username), size=1)
+        hits = resp.get("hits", {}).get("hits", [])
+        if not hits:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+        doc_id = hits[0].get("_id")
+        user = hits[0].get("_source") or {}
+
+        stored_hash = user.get("password_hash")
+        if not stored_hash:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
+        normalized_user = normalize_user(user, username)
+
+    # argon2 is deliberately slow; keep it off the event loop
+    if not await asyncio.to_thread(_verify_password, stored_hash, password):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+
+    if _is_legacy_hash(stored_hash) and doc_id:
+        stored_hash = await _upgrade_password_hash(doc_id, stored_hash, password, settings)
+
+    _user_cache[username] = (doc_id, stored_hash, normalized_user)
+    _verified_logins[username] = (fingerprint, dict(normalized_user))
+    normalized_user = dict(normalized_user)
+
+    # Issue local JWT
+    return {"access_token": _issue_token(normalized_user, settings), "user": normalized_user}
+
+
+async def _upgrade_password_hash(doc_id: str, stored_hash: str, password: str, settings: SaraswatiSettings) -> str:
+    """Replace a verified legacy SHA-256 hash with argon2; returns the hash now on record."""
+    index = settings.elasticsearch and settings.elasticsearch.users_index
+    new_hash = await asyncio.to_thread(_hash_password, password)
+    try:
+        await get_elasticsearch_client(settings).update(index=index, id=doc_id, doc={"password_hash": new_hash})
+    except Exception as exc:
+        # The login itself succeeded; the upgrade is retried on the next one
+        logger.warning("Password hash upgrade failed for user doc %s: %s", doc_id, exc)
+        return stored_hash
+    return new_hash
 
 
 async def register_native(username: str, password: str, name: Optional[str], settings: SaraswatiSettings) -> Dict[str, Any]:
@@ -51,17 +139,36 @@ async def register_native(username: str, password: str, name: Optional[str], set
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Users index not configured")
 
     client = get_elasticsearch_client(settings)
-    password_hash = hashlib.sha256(password.encode("utf-8")).hexdigest()
+    password_hash = await asyncio.to_thread(_hash_password, password)
     doc = {"username": username, "name": name or username, "roles": ["author"], "password_hash": password_hash}
     resp = await client.index(index=index, document=doc)
+    _user_cache.pop(username, None)
+    _verified_logins.pop(username, None)
     return {"ok": True, "id": resp.get("_id")}
 
 
 async def introspect_native(token: str, settings: SaraswatiSettings) -> Dict[str, Any]:
+    key = blake2b(token.encode("utf-8"), digest_size=16).digest()
+    entry = _jwt_cache.get(key)
+    if entry:
+        expiry, cached = entry
+        if expiry > time.time():
+            return dict(cached)
+
     # Locally decode JWTs signed with jwt_secret
     try:
-        payload = jwt.decode(token, settings.auth_native.jwt_secret, algorithms=[settings.auth_native.jwt_algorithm], audience=settings.auth_native.audience)
+        native = settings.auth_native
+        payload = jwt.decode(token, native.jwt_secret_bytes, algorithms=native.algorithms, audience=native.audience)
     except jwt.PyJWTError as exc:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token") from exc
     payload.setdefault("active", True)
+
+    # Cache the verified claims, never past the token's own expiry
+    now = time.time()
+    ttl = _JWT_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, max(0, int(exp - now)))
+    if ttl > 0:
+        _jwt_cache[key] = (now + ttl, dict(payload))
     return payload
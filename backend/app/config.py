@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import os
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Dict, List, Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field, HttpUrl, model_validator
 
+try:  # prefer the libyaml-backed loader when available
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader  # type: ignore[assignment]
 
 DEFAULT_CONFIG_PATH = Path(os.getenv("SARASWATI_CONFIG", Path.cwd() / "config.yml"))
 
@@ -28,6 +32,10 @@ class ExternalAuthConfig(BaseModel):
     )
     audience: Optional[str] = Field(None, description="JWT audience to validate against for tokens returned by the external provider")
     issuer: Optional[str] = Field(None, description="Expected JWT issuer for external tokens")
+    jwks_uri: Optional[HttpUrl] = Field(
+        None,
+        description="JWKS endpoint of the provider. When set, JWTs are verified locally before falling back to introspection.",
+    )
     cache_ttl_seconds: int = Field(300, description="How long to cache token introspection results")
 
 
@@ -43,6 +51,21 @@ class NativeAuthConfig(BaseModel):
     issuer: Optional[str] = Field(None, description="JWT issuer for locally-issued tokens")
     cache_ttl_seconds: int = Field(300, description="Default token TTL (seconds) for locally-issued tokens")
 
+    @cached_property
+    def jwt_secret_bytes(self) -> bytes:
+        """Signing key pre-encoded once instead of on every encode/decode.
+
+        Raises instead of falling back to an empty key: HS256 happily signs and verifies with
+        b"", which would make locally-issued tokens forgeable.
+        """
+        if not self.jwt_secret:
+            raise ValueError("auth_native.jwt_secret is not configured")
+        return self.jwt_secret.encode("utf-8")
+
+    @cached_property
+    def algorithms(self) -> tuple[str, ...]:
+        return (self.jwt_algorithm,)
+
 
 class ElasticsearchConfig(BaseModel):
     """Elasticsearch connectivity configuration."""
@@ -74,6 +97,11 @@ class SaraswatiSettings(BaseModel):
     environment: str = Field("development", description="Environment name")
     frontend_base_path: str = Field("/knowledge", description="Base path for the frontend")
     api_prefix: str = Field("/knowledge/api", description="API route prefix")
+    cors_allowed_origins: List[str] = Field(
+        default_factory=list,
+        description="Origins allowed to make credentialed cross-origin requests (none unless configured)",
+    )
+    cors_allowed_origin_regex: Optional[str] = Field(None, description="Optional regex for additional allowed origins")
     store_backend: Literal["elastic"] = Field(
         "elastic",
         description="Primary persistence backend to use for notes data",
@@ -100,6 +128,7 @@ class SaraswatiSettings(BaseModel):
         events: List[str] = Field(default_factory=list, description="List of event names to receive. Empty list means all events")
 
     webhooks: List[WebhookConfig] = Field(default_factory=list, description="List of observer webhook configs")
+    webhook_concurrency: int = Field(16, description="Maximum concurrent webhook posts per notified event")
 
     @model_validator(mode="after")
     def _validate_backend(self) -> "SaraswatiSettings":
@@ -113,20 +142,32 @@ class SaraswatiSettings(BaseModel):
         return self
 
 
+# Parsed settings per config path, reused until the file's mtime changes.
+_mtime_cache: Dict[Path, tuple[float, SaraswatiSettings]] = {}
+
+
 def _load_yaml(path: Path) -> dict:
     with path.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+        return yaml.load(handle, Loader=SafeLoader) or {}
 
 
 def build_settings(config_path: Optional[Path] = None) -> SaraswatiSettings:
     """Instantiate settings from a YAML file."""
 
     resolved_path = Path(config_path or DEFAULT_CONFIG_PATH)
-    if not resolved_path.exists():
-        raise FileNotFoundError(f"Configuration file not found at {resolved_path}")
+    try:
+        mtime = resolved_path.stat().st_mtime
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found at {resolved_path}") from None
+
+    cached = _mtime_cache.get(resolved_path)
+    if cached and cached[0] == mtime:
+        return cached[1]
 
     data = _load_yaml(resolved_path)
-    return SaraswatiSettings(**data)
+    settings = SaraswatiSettings(**data)
+    _mtime_cache[resolved_path] = (mtime, settings)
+    return settings
 
 
 @lru_cache(maxsize=1)
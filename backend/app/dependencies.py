@@ -2,29 +2,33 @@ from __future__ import annotations
 
 from typing import AsyncIterator
 
-from fastapi import Depends
+from elasticsearch import AsyncElasticsearch
+from fastapi import Depends, Request
 
 from .config import SaraswatiSettings, get_settings
-from .elasticsearch_client import get_elasticsearch_client
+from .elasticsearch_client import get_es
 from .repositories.elastic import ElasticsearchNotesRepository
 from .repositories.interface import NotesRepositoryProtocol
 from .services.notes import NotesService
 from .services.reviews import ReviewsService
 
 
-async def get_app_settings() -> SaraswatiSettings:
-    return get_settings()
+async def get_app_settings(request: Request) -> SaraswatiSettings:
+    # Stays async: FastAPI runs plain `def` dependencies in the threadpool, which costs more
+    # than awaiting a coroutine that just hands back the settings object bound at startup.
+    settings = getattr(request.app.state, "settings", None)
+    return settings if settings is not None else get_settings()
 
 
 async def get_notes_repository(
     settings: SaraswatiSettings = Depends(get_app_settings),
+    client: AsyncElasticsearch = Depends(get_es),
 ) -> AsyncIterator[NotesRepositoryProtocol]:
     if settings.store_backend != "elastic":
         raise ValueError(
             "Only the Elasticsearch backend is supported; update 'store_backend' to 'elastic'."
         )
 
-    client = get_elasticsearch_client(settings)
     yield ElasticsearchNotesRepository(client, settings)
 
 
@@ -1,31 +1,53 @@
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import Any, Dict, Tuple
+from typing import Any
 
+import orjson
 from elasticsearch import AsyncElasticsearch
+from elasticsearch.serializer import JSONSerializer
+from fastapi import Request
 
 from .config import SaraswatiSettings, get_settings
 
 
-def _build_client_kwargs_from_settings(settings: SaraswatiSettings) -> Dict[str, Any]:
-    if not settings.elasticsearch:
-        raise ValueError("Elasticsearch configuration is missing")
-    cfg = settings.elasticsearch
-    kwargs: Dict[str, Any] = {
-        "hosts": cfg.hosts,
-    }
-    return kwargs
+class OrjsonSerializer(JSONSerializer):
+    """JSON (de)serialization for Elasticsearch requests and responses via orjson."""
 
+    def dumps(self, data: Any) -> bytes:
+        if isinstance(data, (str, bytes)):
+            return super().dumps(data)
+        return orjson.dumps(data, default=self.default, option=orjson.OPT_SERIALIZE_NUMPY)
 
-@lru_cache(maxsize=1)
-def _cached_client(hosts_key: Tuple[str, ...]) -> AsyncElasticsearch:
-    # hosts_key is used purely to make the lru_cache key hashable
-    return AsyncElasticsearch(hosts=list(hosts_key))
+    def loads(self, data: bytes) -> Any:
+        return orjson.loads(data)
+
+
+# Register for both the plain and the versioned compatibility mimetypes the client negotiates.
+_SERIALIZER = OrjsonSerializer()
+_SERIALIZERS = {"application/json": _SERIALIZER, "application/vnd.elasticsearch+json": _SERIALIZER}
+
+# Single app-lifetime client; created at startup (or on first use) and closed on shutdown.
+_client: AsyncElasticsearch | None = None
 
 
 def get_elasticsearch_client(settings: SaraswatiSettings | None = None) -> AsyncElasticsearch:
-    cfg = settings or get_settings()
-    kwargs = _build_client_kwargs_from_settings(cfg)
-    hosts = tuple(kwargs.get("hosts", []))
-    return _cached_client(hosts)
+    global _client
+    if _client is None:
+        cfg = (settings or get_settings()).elasticsearch
+        if not cfg:
+            raise ValueError("Elasticsearch configuration is missing")
+        _client = AsyncElasticsearch(hosts=cfg.hosts, serializers=_SERIALIZERS)
+    return _client
+
+
+async def close_elasticsearch_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
+
+
+async def get_es(request: Request) -> AsyncElasticsearch:
+    """FastAPI dependency returning the client bound to the app at startup."""
+    client = getattr(request.app.state, "es", None)
+    return client if client is not None else get_elasticsearch_client()
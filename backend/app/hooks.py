@@ -6,12 +6,151 @@ import asyncio
 import logging
 
 import httpx
+import orjson
 from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
 
 from .config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Shared client for webhook deliveries so posts reuse pooled keep-alive connections.
+_HTTP_CLIENT: httpx.AsyncClient | None = None
+
+
+async def get_http_client() -> httpx.AsyncClient:
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is None or _HTTP_CLIENT.is_closed:
+        _HTTP_CLIENT = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+        )
+    return _HTTP_CLIENT
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+# Webhook config snapshot, read once instead of on every decorated call.
+# `None` means not loaded yet; call `refresh_webhooks_cache()` after changing settings.
+# Hooks are pre-bucketed by event name; hooks with no `events` filter receive everything.
+_WEBHOOKS_ENABLED: bool | None = None
+_WEBHOOKS_BY_EVENT: dict[str, tuple] = {}
+_WEBHOOKS_WILDCARD: tuple = ()
+_WEBHOOK_CONCURRENCY = 16
+
+
+def refresh_webhooks_cache() -> None:
+    """Reload the configured webhooks from settings."""
+    global _WEBHOOKS_ENABLED, _WEBHOOKS_BY_EVENT, _WEBHOOKS_WILDCARD, _WEBHOOK_CONCURRENCY
+    settings = get_settings()
+    hooks = settings.webhooks or []
+    by_event: dict[str, list] = {}
+    wildcard: list = []
+    for hook in hooks:
+        if not hook.events:
+            wildcard.append(hook)
+            continue
+        for event in dict.fromkeys(hook.events):
+            by_event.setdefault(event, []).append(hook)
+    _WEBHOOKS_BY_EVENT = {event: tuple(targets) for event, targets in by_event.items()}
+    _WEBHOOKS_WILDCARD = tuple(wildcard)
+    _WEBHOOK_CONCURRENCY = max(1, settings.webhook_concurrency)
+    _WEBHOOKS_ENABLED = bool(hooks)
+
+
+# Deliveries are queued and drained by a small pool of long-lived workers instead of
+# spawning a task per decorated call, which keeps fan-out bounded under bursts.
+_WEBHOOK_QUEUE_SIZE = 10_000
+_WEBHOOK_WORKERS = 4
+# How long shutdown waits for queued deliveries before cancelling the workers.
+_WEBHOOK_DRAIN_TIMEOUT = 5.0
+_webhook_queue: asyncio.Queue | None = None
+_webhook_loop: asyncio.AbstractEventLoop | None = None
+_worker_tasks: list[asyncio.Task] = []
+
+
+def start_webhook_workers() -> None:
+    """Ensure the delivery queue and its workers run on the current loop (idempotent).
+
+    The queue and workers belong to the loop that created them; when a new loop starts
+    (reload, test clients, a second app) they are rebuilt instead of feeding a dead queue.
+    """
+    global _webhook_queue, _webhook_loop
+    loop = asyncio.get_running_loop()
+    if _webhook_queue is None or _webhook_loop is not loop:
+        _webhook_queue = asyncio.Queue(maxsize=_WEBHOOK_QUEUE_SIZE)
+        _webhook_loop = loop
+        _worker_tasks.clear()
+    _worker_tasks[:] = [task for task in _worker_tasks if not task.done()]
+    while len(_worker_tasks) < _WEBHOOK_WORKERS:
+        _worker_tasks.append(loop.create_task(_webhook_worker(_webhook_queue)))
+
+
+async def stop_webhook_workers(timeout: float = _WEBHOOK_DRAIN_TIMEOUT) -> None:
+    """Let queued deliveries finish (up to `timeout` seconds), then stop the workers."""
+    global _webhook_queue, _webhook_loop
+    queue = _webhook_queue
+    if queue is None or _webhook_loop is not asyncio.get_running_loop():
+        # Nothing started, or the workers died with an earlier loop
+        _worker_tasks.clear()
+        _webhook_queue = _webhook_loop = None
+        return
+    if any(not task.done() for task in _worker_tasks):
+        try:
+            await asyncio.wait_for(queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Dropping %d undelivered webhook notification(s) at shutdown", queue.qsize())
+    for task in _worker_tasks:
+        task.cancel()
+    await asyncio.gather(*_worker_tasks, return_exceptions=True)
+    _worker_tasks.clear()
+    _webhook_queue = _webhook_loop = None
+
+
+async def _webhook_worker(queue: asyncio.Queue) -> None:
+    while True:
+        event_name, body, hooks = await queue.get()
+        try:
+            await _notify_all(hooks, lambda hook: _post(hook, event_name, body))
+        except Exception:  # pragma: no cover - best-effort notify; keep the worker alive
+            logger.exception("Webhook delivery for '%s' failed", event_name)
+        finally:
+            queue.task_done()
+
+
+def _enqueue(event_name: str, body: bytes, hooks: tuple) -> None:
+    if _webhook_queue is None or _webhook_loop is not asyncio.get_running_loop():
+        # Decorated code can run outside the app lifecycle (scripts, tests) or on a newer loop
+        # than the one the workers were started on; (re)start lazily.
+        start_webhook_workers()
+    try:
+        _webhook_queue.put_nowait((event_name, body, hooks))  # type: ignore[union-attr]
+    except asyncio.QueueFull:
+        logger.warning("Webhook queue full; dropping '%s' notification", event_name)
+
+
+async def _post(hook, event_name: str, body: bytes) -> None:
+    # hook is a WebhookConfig pydantic model; body is the JSON payload, encoded once per event
+    try:
+        headers = _JSON_HEADERS
+        if hook.headers:
+            # case-insensitive merge, so a hook's own Content-Type replaces the default
+            headers = httpx.Headers(_JSON_HEADERS)
+            headers.update(hook.headers)
+        client = await get_http_client()
+        resp = await client.post(str(hook.url), content=body, headers=headers)
+        resp.raise_for_status()
+    except Exception as exc:  # pragma: no cover - network dependent
+        logger.warning("Webhook notify failed url=%s err=%s", hook.url, exc)
+
+
+async def close_http_client() -> None:
+    global _HTTP_CLIENT
+    if _HTTP_CLIENT is not None:
+        await _HTTP_CLIENT.aclose()
+        _HTTP_CLIENT = None
+
 
 def notify_observers(event_name: str):
     """Decorator factory that notifies configured webhook URLs after the wrapped
@@ -28,35 +167,27 @@ def notify_observers(event_name: str):
 
         @wraps(func)
         async def wrapper(*args, **kwargs):
+            if _WEBHOOKS_ENABLED is None:
+                refresh_webhooks_cache()
+            if not _WEBHOOKS_ENABLED:
+                return await func(*args, **kwargs)
+
             result = await func(*args, **kwargs)
-            print(f"Notifying observers of event '{event_name}' with result: {result}")
-            settings = get_settings()
-            print(settings)
-            hooks = settings.webhooks or []
-            print(hooks)
-            if not hooks:
+            matching = _WEBHOOKS_BY_EVENT.get(event_name, ()) + _WEBHOOKS_WILDCARD
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("notify event=%s hooks=%d", event_name, len(matching))
+            if not matching:
                 return result
 
             # Convert the result to a JSON-serializable structure (handles pydantic models, datetimes, etc.)
-            serializable_result = jsonable_encoder(result)
+            if isinstance(result, BaseModel):
+                serializable_result = result.model_dump(mode="json", by_alias=True)
+            else:
+                serializable_result = jsonable_encoder(result)
             payload = {"event": event_name, "result": serializable_result}
 
-            async def _post(hook):
-                # hook is a WebhookConfig pydantic model
-                try:
-                    # event filtering: empty events list means subscribe to all
-                    if hook.events and event_name not in hook.events:
-                        return
-                    headers = hook.headers or {}
-                    async with httpx.AsyncClient(timeout=10.0) as client:
-                        print(f"Posting webhook to {hook.url} with payload: {payload} and headers: {headers}")  # Debug print
-                        resp = await client.post(str(hook.url), json=payload, headers=headers)
-                        resp.raise_for_status()
-                except Exception as exc:  # pragma: no cover - network dependent
-                    logger.warning("Webhook notification to %s failed: %s", getattr(hook, 'url', hook), exc)
-
-            # schedule all posts concurrently but don't await them here (fire-and-forget)
-            asyncio.create_task(_notify_all(hooks, _post))
+            # hand off to the delivery workers; don't wait for the posts here (fire-and-forget)
+            _enqueue(event_name, orjson.dumps(payload), matching)
 
             return result
 
@@ -65,12 +196,17 @@ def notify_observers(event_name: str):
     return decorator
 
 
-async def _notify_all(urls: list[str], poster: Callable[[str], Coroutine[Any, Any, None]]):
-    tasks = [poster(u) for u in urls]
-    if not tasks:
+async def _notify_all(hooks: tuple, poster: Callable[[Any], Coroutine[Any, Any, None]]):
+    if not hooks:
         return
-    try:
-        await asyncio.gather(*tasks)
-    except Exception:  # pragma: no cover - best-effort notify
-        # individual failures are already logged in _post; swallow here
-        pass
+    # bound outbound concurrency so a large hook list can't monopolise the connection pool;
+    # individual failures are already logged (and swallowed) in _post
+    semaphore = asyncio.Semaphore(_WEBHOOK_CONCURRENCY)
+
+    async def _guarded(hook) -> None:
+        async with semaphore:
+            await poster(hook)
+
+    async with asyncio.TaskGroup() as group:
+        for hook in hooks:
+            group.create_task(_guarded(hook))
@@ -1,31 +1,54 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException
+from elasticsearch import AsyncElasticsearch
+from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from fastapi.staticfiles import StaticFiles
 
+from .auth_external import close_client as close_auth_client
 from .config import get_settings
-from .elasticsearch_client import get_elasticsearch_client
-from .routes import auth as auth_routes
-from .routes import notes as notes_routes
-from .routes import reviews as reviews_routes
+from .elasticsearch_client import close_elasticsearch_client, get_elasticsearch_client
+from .hooks import (
+    close_http_client as close_webhook_client,
+    refresh_webhooks_cache,
+    start_webhook_workers,
+    stop_webhook_workers,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_elasticsearch(client: AsyncElasticsearch, indices: list[str]) -> None:
+    """Open a pooled connection and touch index metadata so the first request doesn't pay for it."""
+    try:
+        await client.info()
+        await client.indices.exists(index=indices)
+    except Exception as exc:
+        logger.warning("Elasticsearch warmup failed: %s", exc)
 
 
 def create_app() -> FastAPI:
     settings = get_settings()
     app = FastAPI(title="Saraswati Knowledge Notes", version="1.0.0")
+    app.state.settings = settings
 
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=settings.cors_allowed_origins,
+        allow_origin_regex=settings.cors_allowed_origin_regex,
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
+    # Route modules pull in the models/repositories; import them only when an app is built
+    from .routes import auth as auth_routes
+    from .routes import notes as notes_routes
+    from .routes import reviews as reviews_routes
+
     # Register API routes FIRST before static files
     app.include_router(notes_routes.router, prefix=settings.api_prefix)
     app.include_router(reviews_routes.router, prefix=settings.api_prefix)
@@ -45,40 +68,47 @@ def create_app() -> FastAPI:
     frontend_base = frontend_base.rstrip("/") or "/"
 
     if static_dir.exists():
+        from .static_files import HashedAssetsStaticFiles, SPAStaticFiles
+
         # Serve static assets (JS, CSS, images) directly
         assets_path = static_dir / "assets"
         if assets_path.exists():
-            app.mount(f"{frontend_base}/assets", StaticFiles(directory=assets_path), name="assets")
-
-        # SPA fallback for all other frontend routes
-        @app.get(frontend_base, include_in_schema=False)
-        @app.get(f"{frontend_base}/", include_in_schema=False)
-        @app.get(f"{frontend_base}/{{full_path:path}}", include_in_schema=False)
-        async def serve_spa(full_path: str = "") -> HTMLResponse:  # type: ignore[override]
-            # Only serve index.html for non-API routes
-            if full_path.startswith("api/"):
-                raise HTTPException(status_code=404, detail="API endpoint not found")
-            
-            index_path = static_dir / "index.html"
-            if not index_path.exists():
-                raise HTTPException(status_code=404, detail="Frontend build missing")
-            return HTMLResponse(index_path.read_text(encoding="utf-8"))
+            app.mount(f"{frontend_base}/assets", HashedAssetsStaticFiles(directory=assets_path), name="assets")
+
+        # Everything else under the frontend base is the SPA; unknown paths fall back to index.html
+        app.mount(frontend_base, SPAStaticFiles(directory=static_dir, html=True), name="spa")
 
     @app.on_event("startup")
     async def _startup() -> None:
-        # Warm up the Elasticsearch client so failures surface early
-        get_elasticsearch_client(settings)
+        # Create the app-lifetime Elasticsearch client so failures surface early
+        app.state.es = get_elasticsearch_client(settings)
+        es_cfg = settings.elasticsearch
+        if es_cfg:
+            indices = [es_cfg.notes_index, es_cfg.versions_index, es_cfg.reviews_index, es_cfg.review_events_index]
+            # Don't hold up startup on a slow cluster; keep a reference so the task isn't collected
+            app.state.es_warmup = asyncio.create_task(_warm_elasticsearch(app.state.es, indices))
+        refresh_webhooks_cache()
+        start_webhook_workers()
 
     @app.on_event("shutdown")
     async def _shutdown() -> None:
-        client = get_elasticsearch_client(settings)
-        await client.close()
+        app.state.es = None
+        await close_elasticsearch_client()
+        await close_auth_client()
+        await stop_webhook_workers()
+        await close_webhook_client()
 
     return app
 
 
-app = create_app()
+def __getattr__(name: str) -> FastAPI:
+    # `app.main:app` is built on first access, so importing this module (or create_app) stays cheap
+    if name == "app":
+        app = globals()["app"] = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    uvicorn.run(create_app, factory=True, host="0.0.0.0", port=8001)
\ No newline at end of file
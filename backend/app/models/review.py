@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field
+
+from ._time import _utcnow
 
 
 class ReviewStatus(str, Enum):
@@ -25,11 +27,7 @@ class ReviewDecisionState(BaseModel):
 
     decision: ReviewDecision
     comment: Optional[str] = None
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    @field_serializer("updated_at", when_used="json")
-    def serialize_updated_at(self, value: datetime) -> str:
-        return value.isoformat()
+    updated_at: datetime = Field(default_factory=_utcnow)
 
 
 class Review(BaseModel):
@@ -47,29 +45,13 @@ class Review(BaseModel):
     review_decisions: Dict[str, ReviewDecisionState] = Field(default_factory=dict)
     merge_version_id: Optional[str] = None
     merged_by: Optional[str] = None
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=_utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
     merged_at: Optional[datetime] = None
     closed_at: Optional[datetime] = None
     # Optional explicit type for special reviews (deletion, restore, etc.)
     type: Optional[str] = None
 
-    @field_serializer("created_at", when_used="json")
-    def serialize_created_at(self, value: datetime) -> str:
-        return value.isoformat()
-
-    @field_serializer("updated_at", when_used="json")
-    def serialize_updated_at(self, value: datetime) -> str:
-        return value.isoformat()
-
-    @field_serializer("merged_at", when_used="json")
-    def serialize_merged_at(self, value: Optional[datetime]) -> Optional[str]:
-        return value.isoformat() if value else None
-
-    @field_serializer("closed_at", when_used="json")
-    def serialize_closed_at(self, value: Optional[datetime]) -> Optional[str]:
-        return value.isoformat() if value else None
-
 
 class ReviewEventType(str, Enum):
     SUBMITTED = "submitted"
@@ -91,8 +73,4 @@ class ReviewEvent(BaseModel):
     author_id: str
     message: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
-
-    @field_serializer("created_at", when_used="json")
-    def serialize_created_at(self, value: datetime) -> str:
-        return value.isoformat()
+    created_at: datetime = Field(default_factory=_utcnow)
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import asyncio
-import json
-import math
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from enum import Enum
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import uuid4
 
+import numpy as np
 from elasticsearch import AsyncElasticsearch
 from elasticsearch import NotFoundError
+from elasticsearch.helpers import async_bulk
+from pydantic import BaseModel
 
 from ..config import SaraswatiSettings
 from ..models import (
@@ -24,9 +26,161 @@ from ..models import (
 )
 from .interface import NotesRepositoryProtocol
 
+# Embeddings are only consumed server-side by knn; never ship them back to Python on reads.
+_VERSION_SOURCE_EXCLUDES = ["vector"]
+# Only the ReviewEvent fields are fetched for event lists; anything else stored on the doc stays server-side.
+_REVIEW_EVENT_SOURCE_INCLUDES = ["review_id", "event_type", "author_id", "message", "metadata", "created_at"]
+
+# Painless scripts for the per-note version counter. A note without the counter is left
+# untouched (noop) so the caller can seed it from the versions index; the seed itself also
+# reserves an index, so concurrent seeders still end up with distinct values.
+_NEXT_VERSION_INDEX_SCRIPT = (
+    "if (ctx._source.next_version_index == null) { ctx.op = 'noop'; } "
+    "else { ctx._source.next_version_index = Math.max(ctx._source.next_version_index, params.floor) + 1; }"
+)
+_SEED_VERSION_INDEX_SCRIPT = (
+    "ctx._source.next_version_index = Math.max(ctx._source.next_version_index ?: 0, params.next) + 1;"
+)
+
+# Rebuilds the denormalized `involved_users` (author + reviewers) from the review's own fields.
+_INVOLVED_USERS_SCRIPT = (
+    "List users = new ArrayList(); "
+    "if (ctx._source.created_by != null) { users.add(ctx._source.created_by); } "
+    "if (ctx._source.reviewer_ids != null) { users.addAll(ctx._source.reviewer_ids); } "
+    "ctx._source.involved_users = users;"
+)
+# Overwrites each given top-level field wholesale (objects are replaced, not merged), then
+# keeps `involved_users` in step with any author/reviewer change.
+_REPLACE_REVIEW_FIELDS_SCRIPT = (
+    "for (entry in params.fields.entrySet()) { ctx._source[entry.getKey()] = entry.getValue(); } "
+    + _INVOLVED_USERS_SCRIPT
+)
+
+# States hybrid_search can return, in filter order: approved always, then the opt-in ones.
+_SEARCHABLE_STATES = (NoteState.APPROVED, NoteState.NEEDS_REVIEW, NoteState.DELETED)
+
+# Prebuilt value -> member maps; unknown values fall through to model validation.
+_DECISION_LOOKUP: Dict[Any, ReviewDecision] = ReviewDecision._value2member_map_  # type: ignore[assignment]
+_STATUS_LOOKUP: Dict[Any, ReviewStatus] = ReviewStatus._value2member_map_  # type: ignore[assignment]
+_EVENT_TYPE_LOOKUP: Dict[Any, ReviewEventType] = ReviewEventType._value2member_map_  # type: ignore[assignment]
+_NOTE_STATE_LOOKUP: Dict[Any, NoteState] = NoteState._value2member_map_  # type: ignore[assignment]
+
+# Page size for full version scans, and how long a point-in-time stays open between pages.
+_PAGE_SIZE = 200
+_PIT_KEEP_ALIVE = "1m"
+# Upper bound on ids per mget or ids-filtered search; larger lookups are split and sent concurrently.
+_MGET_CHUNK_SIZE = 1000
+# Keep individual bulk requests in the few-MB range Elasticsearch handles best.
+_BULK_MAX_CHUNK_BYTES = 10 * 1024 * 1024
+
+# Index sets already checked/created in this process. Repositories are built per request,
+# so readiness is tracked here (keyed by index names) rather than on the instance.
+_READY_INDEX_SETS: Set[Tuple[str, ...]] = set()
+_INDEX_SETUP_LOCKS: Dict[Tuple[str, ...], asyncio.Lock] = {}
+
+# Indices are created with explicit mappings so fields like `created_at` exist
+# and can be used for sorting. Avoid dynamic mapping surprises.
+_NOTES_MAPPING: Dict[str, Any] = {
+    "mappings": {
+        "properties": {
+            "created_at": {"type": "date"},
+            "created_by": {"type": "keyword"},
+            "committed_by": {"type": "keyword"},
+            "tags": {"type": "keyword"},
+            "current_version_id": {"type": "keyword"},
+            "upvotes": {"type": "integer"},
+            "downvotes": {"type": "integer"},
+            # Next version index to hand out; bumped atomically by create_new_version.
+            "next_version_index": {"type": "integer"},
+        }
+    }
+}
+
+_VERSIONS_MAPPING: Dict[str, Any] = {
+    "mappings": {
+        "properties": {
+            "created_at": {"type": "date"},
+            "note_id": {"type": "keyword"},
+            "created_by": {"type": "keyword"},
+            "submitted_by": {"type": "keyword"},
+            "committed_by": {"type": "keyword"},
+            "reviewed_by": {"type": "keyword"},
+            "state": {"type": "keyword"},
+            "version_index": {"type": "integer"},
+            "tags": {"type": "keyword"},
+            # Embeddings are L2-normalized on write (see _normalize_vector), so knn
+            # can score with a plain dot product instead of cosine. The HNSW graph holds
+            # int8-quantized copies (float32 originals are kept for rescoring).
+            "vector": {
+                "type": "dense_vector",
+                "index": True,
+                "similarity": "dot_product",
+                "index_options": {"type": "int8_hnsw"},
+            },
+        }
+    }
+}
+
+# Set in the reviews mapping's `_meta` once every review carries `involved_users`.
+_INVOLVED_USERS_META = "involved_users_backfilled"
+
+_REVIEWS_MAPPING: Dict[str, Any] = {
+    "mappings": {
+        "_meta": {_INVOLVED_USERS_META: True},
+        "properties": {
+            "created_at": {"type": "date"},
+            "updated_at": {"type": "date"},
+            "merged_at": {"type": "date"},
+            "closed_at": {"type": "date"},
+            "status": {"type": "keyword"},
+            "note_id": {"type": "keyword"},
+            "draft_version_id": {"type": "keyword"},
+            "base_version_id": {"type": "keyword"},
+            "title": {"type": "text"},
+            "description": {"type": "text"},
+            "created_by": {"type": "keyword"},
+            "reviewer_ids": {"type": "keyword"},
+            "involved_users": {"type": "keyword"},
+            "merge_version_id": {"type": "keyword"},
+            "merged_by": {"type": "keyword"},
+            "review_decisions": {"type": "object", "enabled": True},
+        }
+    }
+}
+
+_REVIEW_EVENTS_MAPPING: Dict[str, Any] = {
+    "mappings": {
+        "properties": {
+            "created_at": {"type": "date"},
+            "event_type": {"type": "keyword"},
+            "author_id": {"type": "keyword"},
+            "review_id": {"type": "keyword"},
+            "message": {"type": "text"},
+            "metadata": {"type": "object", "enabled": True},
+        }
+    }
+}
+
+
+def _utcnow_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _parse_datetimes(source: Dict[str, Any], fields: Tuple[str, ...]) -> None:
+    """Parse ISO timestamp strings in place for models built without validation."""
+    for field in fields:
+        value = source.get(field)
+        if isinstance(value, str):
+            source[field] = datetime.fromisoformat(value)
+
+
 class ElasticsearchNotesRepository(NotesRepositoryProtocol):
     """Elasticsearch-backed notes persistence layer."""
 
+    # Hits are documents this class wrote itself, so by default they are materialized
+    # with model_construct (no re-validation). Set to False to validate every hit.
+    trust_source: bool = True
+
     def __init__(self, client: AsyncElasticsearch, settings: SaraswatiSettings) -> None:
         if not settings.elasticsearch:
             raise ValueError("Elasticsearch settings are required for the elastic store backend")
@@ -37,204 +191,165 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         self._versions_index = self._cfg.versions_index
         self._reviews_index = self._cfg.reviews_index
         self._review_events_index = self._cfg.review_events_index
-        self._indices_ready = False
-        self._indices_lock = asyncio.Lock()
+        self._index_specs: Dict[str, Dict[str, Any]] = {
+            self._notes_index: _NOTES_MAPPING,
+            self._versions_index: _VERSIONS_MAPPING,
+            self._reviews_index: _REVIEWS_MAPPING,
+            self._review_events_index: _REVIEW_EVENTS_MAPPING,
+        }
+        self._index_key = tuple(self._index_specs)
+        self._indices_ready = self._index_key in _READY_INDEX_SETS
 
     async def _ensure_indices(self) -> None:
-        if self._indices_ready:
-            return
-        async with self._indices_lock:
-            if self._indices_ready:
+        # Call sites check `self._indices_ready` first so the ready path costs no await.
+        lock = _INDEX_SETUP_LOCKS.setdefault(self._index_key, asyncio.Lock())
+        async with lock:
+            if self._index_key in _READY_INDEX_SETS:
+                self._indices_ready = True
                 return
-            # Create indices with explicit mappings so fields like `created_at` exist
-            # and can be used for sorting. Avoid dynamic mapping surprises.
-            notes_mapping = {
-                "mappings": {
-                    "properties": {
-                        "created_at": {"type": "date"},
-                        "created_by": {"type": "keyword"},
-                        "committed_by": {"type": "keyword"},
-                        "tags": {"type": "keyword"},
-                        "current_version_id": {"type": "keyword"},
-                        "upvotes": {"type": "integer"},
-                        "downvotes": {"type": "integer"},
-                    }
-                }
-            }
-
-            versions_mapping = {
-                "mappings": {
-                    "properties": {
-                        "created_at": {"type": "date"},
-                        "note_id": {"type": "keyword"},
-                        "created_by": {"type": "keyword"},
-                        "submitted_by": {"type": "keyword"},
-                        "committed_by": {"type": "keyword"},
-                        "reviewed_by": {"type": "keyword"},
-                        "state": {"type": "keyword"},
-                        "version_index": {"type": "integer"},
-                        "tags": {"type": "keyword"},
-                    }
-                }
-            }
-
-            reviews_mapping = {
-                "mappings": {
-                    "properties": {
-                        "created_at": {"type": "date"},
-                        "updated_at": {"type": "date"},
-                        "merged_at": {"type": "date"},
-                        "closed_at": {"type": "date"},
-                        "status": {"type": "keyword"},
-                        "note_id": {"type": "keyword"},
-                        "draft_version_id": {"type": "keyword"},
-                        "base_version_id": {"type": "keyword"},
-                        "title": {"type": "text"},
-                        "description": {"type": "text"},
-                        "created_by": {"type": "keyword"},
-                        "reviewer_ids": {"type": "keyword"},
-                        "merge_version_id": {"type": "keyword"},
-                        "merged_by": {"type": "keyword"},
-                        "review_decisions": {"type": "object", "enabled": True},
-                    }
-                }
-            }
-
-            review_events_mapping = {
-                "mappings": {
-                    "properties": {
-                        "created_at": {"type": "date"},
-                        "event_type": {"type": "keyword"},
-                        "author_id": {"type": "keyword"},
-                        "review_id": {"type": "keyword"},
-                        "message": {"type": "text"},
-                        "metadata": {"type": "object", "enabled": True},
-                    }
-                }
-            }
-
-            exists = await self.client.indices.exists(index=self._notes_index)
-            if not exists:
-                await self.client.indices.create(index=self._notes_index, body=notes_mapping)
-
-            exists = await self.client.indices.exists(index=self._versions_index)
-            if not exists:
-                await self.client.indices.create(index=self._versions_index, body=versions_mapping)
+            # One round-trip to learn which indices exist, then create the rest concurrently
+            response = await self.client.indices.get(
+                index=",".join(self._index_specs), ignore_unavailable=True, allow_no_indices=True
+            )
+            # The response is keyed by concrete index; a configured name may be an alias of one
+            existing: Dict[str, Dict[str, Any]] = {}
+            for concrete, info in response.items():
+                existing[concrete] = info
+                for alias in info.get("aliases") or {}:
+                    existing.setdefault(alias, info)
+            missing = [name for name in self._index_specs if name not in existing]
+            if missing:
+                await asyncio.gather(
+                    *(self.client.indices.create(index=name, body=self._index_specs[name]) for name in missing)
+                )
+            reviews_meta = existing.get(self._reviews_index, {}).get("mappings", {}).get("_meta") or {}
+            if self._reviews_index in existing and not reviews_meta.get(_INVOLVED_USERS_META):
+                await self._backfill_involved_users(reviews_meta)
+            _READY_INDEX_SETS.add(self._index_key)
+            self._indices_ready = True
 
-            exists = await self.client.indices.exists(index=self._reviews_index)
-            if not exists:
-                await self.client.indices.create(index=self._reviews_index, body=reviews_mapping)
+    async def _backfill_involved_users(self, meta: Dict[str, Any]) -> None:
+        """One-off migration for reviews indexed before `involved_users` existed.
 
-            exists = await self.client.indices.exists(index=self._review_events_index)
-            if not exists:
-                await self.client.indices.create(index=self._review_events_index, body=review_events_mapping)
-            self._indices_ready = True
+        The mapping's `_meta` marker is only set after the backfill finishes, so an interrupted
+        run is retried on the next start.
+        """
+        await self.client.indices.put_mapping(
+            index=self._reviews_index, properties={"involved_users": {"type": "keyword"}}
+        )
+        await self.client.update_by_query(
+            index=self._reviews_index,
+            query={"bool": {"must_not": [{"exists": {"field": "involved_users"}}]}},
+            script={"source": _INVOLVED_USERS_SCRIPT},
+            conflicts="proceed",
+            refresh=True,
+        )
+        await self.client.indices.put_mapping(index=self._reviews_index, meta={**meta, _INVOLVED_USERS_META: True})
 
     @staticmethod
     def _note_to_document(note: Note) -> Dict[str, Any]:
-        doc = json.loads(note.model_dump_json(by_alias=True))
         # Elasticsearch treats `_id` as a metadata field; don't include it inside the
         # document body when calling index(). The API accepts the id separately.
-        doc.pop("_id", None)
-        return doc
+        return note.model_dump(mode="json", by_alias=True, exclude={"id"})
 
     @staticmethod
     def _version_to_document(version: NoteVersion) -> Dict[str, Any]:
-        doc = json.loads(version.model_dump_json(by_alias=True))
-        doc.pop("_id", None)
-        return doc
+        document = version.model_dump(mode="json", by_alias=True, exclude={"id"})
+        if document.get("vector") is None:
+            # dense_vector rejects empty vectors; a version without an embedding just omits the field
+            document.pop("vector", None)
+        return document
 
     @staticmethod
     def _review_to_document(review: Review) -> Dict[str, Any]:
-        doc = json.loads(review.model_dump_json(by_alias=True))
-        doc.pop("_id", None)
-        doc["status"] = review.status.value if isinstance(review.status, ReviewStatus) else doc.get("status")
-        serialized_decisions: Dict[str, Any] = {}
-        for user_id, state in review.review_decisions.items():
-            serialized_decisions[user_id] = {
-                "decision": state.decision.value if isinstance(state.decision, ReviewDecision) else state.decision,
-                "comment": state.comment,
-                "updated_at": state.updated_at.isoformat(),
-            }
-        doc["review_decisions"] = serialized_decisions
-        return doc
+        # mode="json" already emits enum values and ISO timestamps, including nested decisions
+        document = review.model_dump(mode="json", by_alias=True, exclude={"id"})
+        document["involved_users"] = [review.created_by, *review.reviewer_ids]
+        return document
 
     @staticmethod
     def _review_event_to_document(event: ReviewEvent) -> Dict[str, Any]:
-        doc = json.loads(event.model_dump_json(by_alias=True))
-        doc.pop("_id", None)
-        doc["event_type"] = event.event_type.value if isinstance(event.event_type, ReviewEventType) else doc.get("event_type")
-        return doc
+        return event.model_dump(mode="json", by_alias=True, exclude={"id"})
 
     @staticmethod
-    def _cosine_similarity(a: Iterable[float], b: Iterable[float]) -> float:
-        a_list = list(a)
-        b_list = list(b)
-        if not a_list or not b_list or len(a_list) != len(b_list):
-            return 0.0
-        dot = sum(x * y for x, y in zip(a_list, b_list))
-        norm_a = math.sqrt(sum(x * x for x in a_list))
-        norm_b = math.sqrt(sum(y * y for y in b_list))
-        if not norm_a or not norm_b:
-            return 0.0
-        return dot / (norm_a * norm_b)
+    def _normalize_vector(vector: Optional[List[float]]) -> Optional[List[float]]:
+        """Scale `vector` to unit length, or None for empty/all-zero vectors.
 
-    @staticmethod
-    def _hit_to_note(hit: Dict[str, Any]) -> Note:
+        The dot_product `dense_vector` mapping only accepts unit vectors, so anything that can't be
+        normalized (e.g. the `[]` an embedding timeout yields) is stored as "no embedding".
+        """
+        if not vector:
+            return None
+        arr = np.asarray(vector, dtype=np.float32)
+        norm = float(np.linalg.norm(arr))
+        if not norm:
+            return None
+        return (arr / norm).tolist()
+
+    @classmethod
+    def _hit_to_note(cls, hit: Dict[str, Any]) -> Note:
         source = dict(hit.get("_source", {}))
         source["_id"] = hit.get("_id")
-        return Note.parse_obj(source)
+        if cls.trust_source:
+            _parse_datetimes(source, ("created_at", "deleted_at"))
+            return Note.model_construct(**source)
+        return Note.model_validate(source)
 
-    @staticmethod
-    def _hit_to_version(hit: Dict[str, Any]) -> NoteVersion:
+    @classmethod
+    def _hit_to_version(cls, hit: Dict[str, Any]) -> NoteVersion:
         source = dict(hit.get("_source", {}))
         source["_id"] = hit.get("_id")
-        return NoteVersion.parse_obj(source)
-
-    @staticmethod
-    def _hit_to_review(hit: Dict[str, Any]) -> Review:
+        if cls.trust_source:
+            _parse_datetimes(source, ("created_at",))
+            state = source.get("state")
+            if isinstance(state, str):
+                source["state"] = _NOTE_STATE_LOOKUP.get(state, state)
+            return NoteVersion.model_construct(**source)
+        return NoteVersion.model_validate(source)
+
+    @classmethod
+    def _hit_to_review(cls, hit: Dict[str, Any]) -> Review:
         source = dict(hit.get("_source", {}))
         source["_id"] = hit.get("_id")
+        source.pop("involved_users", None)
         decisions = source.get("review_decisions", {}) or {}
-        normalized: Dict[str, ReviewDecisionState] = {}
+        normalized: Dict[str, Any] = {}
         for user_id, payload in decisions.items():
-            decision_value = payload.get("decision") if isinstance(payload, dict) else payload
-            comment = payload.get("comment") if isinstance(payload, dict) else None
-            updated_at_raw = payload.get("updated_at") if isinstance(payload, dict) else None
-            if isinstance(updated_at_raw, str):
-                try:
-                    updated_at = datetime.fromisoformat(updated_at_raw)
-                except ValueError:
-                    updated_at = datetime.now(timezone.utc)
-            elif isinstance(updated_at_raw, datetime):
-                updated_at = updated_at_raw
+            # Validation parses the ISO timestamps itself; a missing timestamp falls back
+            # to the model default.
+            if not isinstance(payload, dict):
+                payload = {"decision": payload}
+            elif payload.get("updated_at") is None:
+                payload = {k: v for k, v in payload.items() if k != "updated_at"}
+            decision = payload.get("decision")
+            payload = {**payload, "decision": _DECISION_LOOKUP.get(decision, decision)}
+            if cls.trust_source:
+                _parse_datetimes(payload, ("updated_at",))
+                normalized[user_id] = ReviewDecisionState.model_construct(**payload)
             else:
-                updated_at = datetime.now(timezone.utc)
-            normalized[user_id] = ReviewDecisionState(
-                decision=ReviewDecision(decision_value),
-                comment=comment,
-                updated_at=updated_at,
-            )
+                normalized[user_id] = payload
         source["review_decisions"] = normalized
         status = source.get("status")
         if isinstance(status, str):
-            source["status"] = ReviewStatus(status)
-        return Review.parse_obj(source)
-
-    @staticmethod
-    def _hit_to_review_event(hit: Dict[str, Any]) -> ReviewEvent:
+            source["status"] = _STATUS_LOOKUP.get(status, status)
+        if cls.trust_source:
+            _parse_datetimes(source, ("created_at", "updated_at", "merged_at", "closed_at"))
+            return Review.model_construct(**source)
+        return Review.model_validate(source)
+
+    @classmethod
+    def _hit_to_review_event(cls, hit: Dict[str, Any]) -> ReviewEvent:
         source = dict(hit.get("_source", {}))
         source["_id"] = hit.get("_id")
         event_type = source.get("event_type")
         if isinstance(event_type, str):
-            source["event_type"] = ReviewEventType(event_type)
-        created_at = source.get("created_at")
-        if isinstance(created_at, str):
-            try:
-                source["created_at"] = datetime.fromisoformat(created_at)
-            except ValueError:
-                source["created_at"] = datetime.now(timezone.utc)
-        return ReviewEvent.parse_obj(source)
+            source["event_type"] = _EVENT_TYPE_LOOKUP.get(event_type, event_type)
+        if source.get("created_at") is None:
+            source.pop("created_at", None)
+        if cls.trust_source:
+            _parse_datetimes(source, ("created_at",))
+            return ReviewEvent.model_construct(**source)
+        return ReviewEvent.model_validate(source)
 
     async def create_note_with_version(
         self,
@@ -244,7 +359,8 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         author_id: str,
         vector: Optional[List[float]] = None,
     ) -> Tuple[Note, NoteVersion]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         note_id = uuid4().hex
         version_id = uuid4().hex
 
@@ -266,25 +382,27 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
             tags=tags,
             created_by=author_id,
             state=NoteState.DRAFT,
-            vector=vector,
+            vector=self._normalize_vector(vector),
         )
 
-        await self.client.index(
-            index=self._notes_index,
-            id=note_id,
-            document=self._note_to_document(note),
-            refresh="wait_for",
-        )
-        await self.client.index(
-            index=self._versions_index,
-            id=version_id,
-            document=self._version_to_document(version),
-            refresh="wait_for",
-        )
+        # Index the note and its first version in one request with a single refresh wait
+        note_doc = self._note_to_document(note)
+        note_doc["next_version_index"] = 1
+        actions = [
+            {"_op_type": "index", "_index": self._notes_index, "_id": note_id, "_source": note_doc},
+            {
+                "_op_type": "index",
+                "_index": self._versions_index,
+                "_id": version_id,
+                "_source": self._version_to_document(version),
+            },
+        ]
+        await async_bulk(self.client, actions, refresh="wait_for")
         return note, version
 
     async def get_note(self, note_id: str) -> Optional[Note]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         try:
             doc = await self.client.get(index=self._notes_index, id=note_id)
         except NotFoundError:
@@ -292,17 +410,22 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         return self._hit_to_note(doc)
 
     async def get_version(self, version_id: str) -> Optional[NoteVersion]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         try:
-            doc = await self.client.get(index=self._versions_index, id=version_id)
+            doc = await self.client.get(
+                index=self._versions_index, id=version_id, source_excludes=_VERSION_SOURCE_EXCLUDES
+            )
         except NotFoundError:
             return None
         return self._hit_to_version(doc)
 
     async def get_latest_version(self, note_id: str) -> Optional[NoteVersion]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         response = await self.client.search(
             index=self._versions_index,
+            source_excludes=_VERSION_SOURCE_EXCLUDES,
             size=1,
             query={"term": {"note_id": note_id}},
             sort=[{"version_index": {"order": "desc"}}],
@@ -312,46 +435,139 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
             return None
         return self._hit_to_version(hits[0])
 
-    async def list_note_versions(self, note_id: str) -> List[NoteVersion]:
-        await self._ensure_indices()
+    async def _iter_versions(
+        self,
+        query: Dict[str, Any],
+        sort: List[Dict[str, Any]],
+        page_size: int = _PAGE_SIZE,
+    ) -> AsyncIterator[NoteVersion]:
+        """Yield every version matching `query` in `sort` order, without a row cap.
+
+        Small result sets (the common case) come back from a single search. When the first
+        page is full the scan restarts inside a point-in-time and pages with `search_after`.
+        """
         response = await self.client.search(
             index=self._versions_index,
-            size=500,
-            query={"term": {"note_id": note_id}},
-            sort=[{"version_index": {"order": "asc"}}],
+            source_excludes=_VERSION_SOURCE_EXCLUDES,
+            size=page_size,
+            query=query,
+            sort=sort,
         )
-        return [self._hit_to_version(hit) for hit in response.get("hits", {}).get("hits", [])]
+        hits = response.get("hits", {}).get("hits", [])
+        if len(hits) < page_size:
+            for hit in hits:
+                yield self._hit_to_version(hit)
+            return
+
+        pit_id = (await self.client.open_point_in_time(index=self._versions_index, keep_alive=_PIT_KEEP_ALIVE))["id"]
+        try:
+            search_after: Optional[List[Any]] = None
+            while True:
+                page_kwargs: Dict[str, Any] = {"search_after": search_after} if search_after is not None else {}
+                response = await self.client.search(
+                    pit={"id": pit_id, "keep_alive": _PIT_KEEP_ALIVE},
+                    source_excludes=_VERSION_SOURCE_EXCLUDES,
+                    size=page_size,
+                    query=query,
+                    sort=sort,
+                    **page_kwargs,
+                )
+                pit_id = response.get("pit_id", pit_id)
+                hits = response.get("hits", {}).get("hits", [])
+                for hit in hits:
+                    yield self._hit_to_version(hit)
+                if len(hits) < page_size:
+                    return
+                search_after = hits[-1]["sort"]
+        finally:
+            await self.client.close_point_in_time(id=pit_id)
+
+    async def list_note_versions(self, note_id: str) -> List[NoteVersion]:
+        if not self._indices_ready:
+            await self._ensure_indices()
+        return [
+            version
+            async for version in self._iter_versions(
+                {"term": {"note_id": note_id}},
+                [{"version_index": {"order": "asc"}}],
+            )
+        ]
 
     async def list_review_queue(self) -> List[NoteVersion]:
-        await self._ensure_indices()
-        response = await self.client.search(
-            index=self._versions_index,
-            size=500,
-            query={"term": {"state": NoteState.NEEDS_REVIEW.value}},
-            sort=[{"created_at": {"order": "asc"}}],
-        )
-        return [self._hit_to_version(hit) for hit in response.get("hits", {}).get("hits", [])]
+        if not self._indices_ready:
+            await self._ensure_indices()
+        return [
+            version
+            async for version in self._iter_versions(
+                {"term": {"state": NoteState.NEEDS_REVIEW.value}},
+                [{"created_at": {"order": "asc"}}],
+            )
+        ]
 
     async def update_version(self, version_id: str, updates: Dict[str, Any]) -> Optional[NoteVersion]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         payload: Dict[str, Any] = {}
         for key, value in updates.items():
             if isinstance(value, NoteState):
                 payload[key] = value.value
+            elif key == "vector":
+                payload[key] = self._normalize_vector(value)
             else:
                 payload[key] = value
         if not payload:
             return await self.get_version(version_id)
         try:
-            await self.client.update(
+            # `_source` on the update response returns the merged document; no follow-up get
+            response = await self.client.update(
                 index=self._versions_index,
                 id=version_id,
                 doc=payload,
                 refresh="wait_for",
+                source={"excludes": _VERSION_SOURCE_EXCLUDES},
             )
         except NotFoundError:
             return None
-        return await self.get_version(version_id)
+        return self._hit_to_version({"_id": version_id, "_source": response["get"]["_source"]})
+
+    async def _allocate_version_index(self, note_id: str, floor: int) -> int:
+        """Atomically reserve the next version index for a note (never below `floor`)."""
+        try:
+            response = await self.client.update(
+                index=self._notes_index,
+                id=note_id,
+                script={"source": _NEXT_VERSION_INDEX_SCRIPT, "params": {"floor": floor}},
+                source={"includes": ["next_version_index"]},
+                retry_on_conflict=3,
+            )
+        except NotFoundError:
+            response = None
+        if response is not None and response.get("result") != "noop":
+            return int(response["get"]["_source"]["next_version_index"]) - 1
+
+        # Notes written before the counter existed: derive the index from the latest
+        # version once, then seed the counter so later calls take the atomic path.
+        latest = await self.client.search(
+            index=self._versions_index,
+            size=1,
+            source=False,
+            query={"term": {"note_id": note_id}},
+            sort=[{"version_index": {"order": "desc"}}],
+        )
+        hits = latest.get("hits", {}).get("hits", [])
+        next_index = max(int(hits[0]["sort"][0]) + 1, floor) if hits else floor
+        if response is None:
+            return next_index
+        # The seed reserves its index in the same scripted update: if another writer seeded or
+        # bumped the counter since our read, we get the slot after theirs instead of a duplicate.
+        seeded = await self.client.update(
+            index=self._notes_index,
+            id=note_id,
+            script={"source": _SEED_VERSION_INDEX_SCRIPT, "params": {"next": next_index}},
+            source={"includes": ["next_version_index"]},
+            retry_on_conflict=3,
+        )
+        return int(seeded["get"]["_source"]["next_version_index"]) - 1
 
     async def create_new_version(
         self,
@@ -363,19 +579,9 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         tags: Optional[List[str]] = None,
         vector: Optional[List[float]] = None,
     ) -> NoteVersion:
-        await self._ensure_indices()
-        response = await self.client.search(
-            index=self._versions_index,
-            size=1,
-            query={"term": {"note_id": note_id}},
-            sort=[{"version_index": {"order": "desc"}}],
-        )
-        hits = response.get("hits", {}).get("hits", [])
-        latest_index = base_version.version_index
-        if hits:
-            latest = self._hit_to_version(hits[0])
-            latest_index = max(latest.version_index, base_version.version_index)
-        next_index = latest_index + 1
+        if not self._indices_ready:
+            await self._ensure_indices()
+        next_index = await self._allocate_version_index(note_id, base_version.version_index + 1)
 
         version_id = uuid4().hex
         version = NoteVersion(
@@ -387,7 +593,7 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
             tags=tags or base_version.tags,
             created_by=author_id,
             state=NoteState.DRAFT,
-            vector=vector,
+            vector=self._normalize_vector(vector),
         )
         await self.client.index(
             index=self._versions_index,
@@ -403,7 +609,8 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         version_id: Optional[str],
         committed_by: Optional[str],
     ) -> None:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         try:
             await self.client.update(
                 index=self._notes_index,
@@ -412,65 +619,79 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
                     "current_version_id": version_id,
                     "committed_by": committed_by,
                 },
-                refresh="wait_for",
+                refresh=False,
             )
         except NotFoundError:
             return
 
     async def delete_note(self, note_id: str) -> None:
-        await self._ensure_indices()
-        await self.client.delete(index=self._notes_index, id=note_id, ignore=[404], refresh="wait_for")
-        await self.client.delete_by_query(
-            index=self._versions_index,
-            query={"term": {"note_id": note_id}},
-            refresh=True,
+        if not self._indices_ready:
+            await self._ensure_indices()
+        # The note doc and its versions live in separate indices; remove both at once.
+        await asyncio.gather(
+            self.client.delete(index=self._notes_index, id=note_id, ignore=[404], refresh=False),
+            self.client.delete_by_query(
+                index=self._versions_index,
+                query={"term": {"note_id": note_id}},
+                refresh=False,
+            ),
         )
 
     async def mark_note_deleted(self, note_id: str, deleter_id: str) -> None:
         """Mark a note as deleted by setting deleted_at and deleted_by fields."""
-        from datetime import datetime, timezone
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         await self.client.update(
             index=self._notes_index,
             id=note_id,
-            body={
-                "doc": {
-                    "deleted_at": datetime.now(timezone.utc).isoformat(),
-                    "deleted_by": deleter_id
-                }
-            },
-            refresh="wait_for",
+            doc={"deleted_at": _utcnow_iso(), "deleted_by": deleter_id},
+            refresh=False,
         )
 
     async def mark_note_restored(self, note_id: str, restorer_id: str) -> None:
         """Clear deleted fields in elastic document to restore a note."""
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         await self.client.update(
             index=self._notes_index,
             id=note_id,
-            body={
-                "doc": {"deleted_at": None, "deleted_by": None}
-            },
-            refresh="wait_for",
+            doc={"deleted_at": None, "deleted_by": None},
+            refresh=False,
         )
 
-    async def get_notes_by_ids(self, note_ids: Iterable[str]) -> Dict[str, Note]:
-        await self._ensure_indices()
-        ids = [note_id for note_id in note_ids if note_id]
+    async def _mget_notes(self, note_ids: Iterable[str], **mget_kwargs: Any) -> List[Dict[str, Any]]:
+        """Found note docs for `note_ids`, fetched in concurrent mget chunks."""
+        if not self._indices_ready:
+            await self._ensure_indices()
+        ids = list(dict.fromkeys(note_id for note_id in note_ids if note_id))
         if not ids:
-            return {}
-        response = await self.client.mget(index=self._notes_index, ids=ids)
+            return []
+        responses = await asyncio.gather(
+            *(
+                self.client.mget(index=self._notes_index, ids=ids[start:start + _MGET_CHUNK_SIZE], **mget_kwargs)
+                for start in range(0, len(ids), _MGET_CHUNK_SIZE)
+            )
+        )
+        return [doc for response in responses for doc in response.get("docs", []) if doc.get("found")]
+
+    async def get_notes_by_ids(self, note_ids: Iterable[str]) -> Dict[str, Note]:
         results: Dict[str, Note] = {}
-        for doc in response.get("docs", []):
-            if not doc.get("found"):
-                continue
+        for doc in await self._mget_notes(note_ids):
             source = dict(doc.get("_source", {}))
-            source["_id"] = doc.get("_id")
-            note = Note.parse_obj(source)
+            source["_id"] = doc["_id"]
+            note = Note.model_validate(source)
             if note.id:
                 results[note.id] = note
         return results
 
+    async def get_note_deletion_markers(self, note_ids: Iterable[str]) -> Dict[str, Optional[datetime]]:
+        """Map each existing note id to its `deleted_at` (None when live), loading only that field."""
+        markers: Dict[str, Optional[datetime]] = {}
+        for doc in await self._mget_notes(note_ids, source_includes=["deleted_at"]):
+            deleted_at = (doc.get("_source") or {}).get("deleted_at")
+            markers[doc["_id"]] = datetime.fromisoformat(deleted_at) if isinstance(deleted_at, str) else deleted_at
+        return markers
+
     async def update_vote_counts(
         self,
         note_id: str,
@@ -478,7 +699,8 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         up_delta: int = 0,
         down_delta: int = 0,
     ) -> Optional[Note]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         script = {
             "source": (
                 "ctx._source.upvotes = Math.max(0, (ctx._source.upvotes ?: 0) + params.up_delta);"
@@ -487,15 +709,16 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
             "params": {"up_delta": up_delta, "down_delta": down_delta},
         }
         try:
-            await self.client.update(
+            response = await self.client.update(
                 index=self._notes_index,
                 id=note_id,
                 script=script,
                 refresh="wait_for",
+                source=True,
             )
         except NotFoundError:
             return None
-        return await self.get_note(note_id)
+        return self._hit_to_note({"_id": note_id, "_source": response["get"]["_source"]})
 
     async def hybrid_search(
         self,
@@ -511,18 +734,23 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         committed_by: Optional[str] = None,
         reviewed_by: Optional[str] = None,
         sort_by: Optional[str] = None,
+        facets: bool = True,
     ) -> Tuple[List[Tuple[NoteVersion, float]], int, Dict[str, List[str]]]:
-        await self._ensure_indices()
-        
-        resolved_states = [NoteState.APPROVED.value]
-        if include_drafts:
-            resolved_states.append(NoteState.NEEDS_REVIEW.value)
-        if allow_deleted:
-            resolved_states.append(NoteState.DELETED.value)
-
-        filter_clauses: List[Dict[str, Any]] = [
-            {"terms": {"state": resolved_states}},
-        ]
+        if not self._indices_ready:
+            await self._ensure_indices()
+
+        # Canonical state filter: the common approved-only search becomes a single `term`
+        # so it shares one cache entry instead of a one-element `terms` clause.
+        selected_states = tuple(
+            state.value
+            for state, enabled in zip(_SEARCHABLE_STATES, (True, include_drafts, allow_deleted))
+            if enabled
+        )
+        if len(selected_states) == 1:
+            state_filter: Dict[str, Any] = {"term": {"state": selected_states[0]}}
+        else:
+            state_filter = {"terms": {"state": list(selected_states)}}
+        filter_clauses: List[Dict[str, Any]] = [state_filter]
         if author:
             filter_clauses.append({"term": {"created_by": author}})
         if committed_by:
@@ -561,15 +789,19 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
 
         search_kwargs: Dict[str, Any] = {
             "index": self._versions_index,
+            "source_excludes": _VERSION_SOURCE_EXCLUDES,
             "size": max(limit, 10),
             "track_total_hits": True,
-            "aggs": {
+        }
+        if facets:
+            # Facet aggregations are the expensive part of the query; callers paging
+            # through results they already have facets for can skip them.
+            search_kwargs["aggs"] = {
                 "authors": {"terms": {"field": "created_by", "size": 100}},
                 "committers": {"terms": {"field": "committed_by", "size": 100}},
                 "reviewers": {"terms": {"field": "reviewed_by", "size": 100}},
                 "tags": {"terms": {"field": "tags", "size": 200}},
-            },
-        }
+            }
 
         if sort_clauses:
             search_kwargs["sort"] = sort_clauses
@@ -579,10 +811,11 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         else:
             search_kwargs["query"] = {"match_all": {}}
 
-        if vector:
+        query_vector = self._normalize_vector(vector)
+        if query_vector:
             search_kwargs["knn"] = {
                 "field": "vector",
-                "query_vector": vector,
+                "query_vector": query_vector,
                 "k": max(limit * 2, 20),
                 "num_candidates": max(limit * 10, 200),
             }
@@ -601,52 +834,64 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         aggregations = response.get("aggregations", {}) or {}
 
         def _extract(name: str) -> List[str]:
-            buckets = aggregations.get(name, {}).get("buckets", [])
-            values = [bucket.get("key") for bucket in buckets if isinstance(bucket.get("key"), str) and bucket.get("key")]
-            return sorted(set(values))
+            # `terms` buckets never repeat a key; the frontend sorts facet options itself.
+            return [key for bucket in aggregations.get(name, {}).get("buckets", ()) if isinstance(key := bucket.get("key"), str) and key]
 
-        facets = {
+        facet_values = {
             "authors": _extract("authors"),
             "committers": _extract("committers"),
             "reviewers": _extract("reviewers"),
             "tags": _extract("tags"),
         }
-        return results, total, facets
+        return results, total, facet_values
 
     async def get_drafts_by_note_ids(self, note_ids: Iterable[str]) -> Dict[str, NoteVersion]:
-        await self._ensure_indices()
-        ids = [note_id for note_id in note_ids if note_id]
+        if not self._indices_ready:
+            await self._ensure_indices()
+        ids = list(dict.fromkeys(note_id for note_id in note_ids if note_id))
         if not ids:
             return {}
-        response = await self.client.search(
-            index=self._versions_index,
-            size=len(ids) * 10,
-            query={
-                "bool": {
-                    "must": [
-                        {"terms": {"note_id": ids}},
-                        {"term": {"state": NoteState.DRAFT.value}},
-                    ]
-                }
-            },
-            sort=[{"version_index": {"order": "desc"}}],
+        # Collapsing on note_id makes Elasticsearch return only the newest draft per note,
+        # so at most one hit per requested note crosses the wire.
+        responses = await asyncio.gather(
+            *(
+                self.client.search(
+                    index=self._versions_index,
+                    source_excludes=_VERSION_SOURCE_EXCLUDES,
+                    size=len(chunk),
+                    query={
+                        "bool": {
+                            "filter": [
+                                {"terms": {"note_id": chunk}},
+                                {"term": {"state": NoteState.DRAFT.value}},
+                            ]
+                        }
+                    },
+                    collapse={"field": "note_id"},
+                    sort=[{"version_index": {"order": "desc"}}],
+                    track_total_hits=False,
+                )
+                for chunk in (ids[start:start + _MGET_CHUNK_SIZE] for start in range(0, len(ids), _MGET_CHUNK_SIZE))
+            )
         )
         drafts: Dict[str, NoteVersion] = {}
-        for hit in response.get("hits", {}).get("hits", []):
-            version = self._hit_to_version(hit)
-            existing = drafts.get(version.note_id)
-            if not existing or existing.version_index < version.version_index:
+        for response in responses:
+            for hit in response.get("hits", {}).get("hits", []):
+                version = self._hit_to_version(hit)
                 drafts[version.note_id] = version
         return drafts
 
     async def delete_version(self, version_id: str) -> None:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         await self.client.delete(index=self._versions_index, id=version_id, ignore=[404], refresh="wait_for")
 
     async def list_user_drafts(self, author_id: str, limit: int = 50) -> List[NoteVersion]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         response = await self.client.search(
             index=self._versions_index,
+            source_excludes=_VERSION_SOURCE_EXCLUDES,
             size=limit,
             query={
                 "bool": {
@@ -661,7 +906,8 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         return [self._hit_to_version(hit) for hit in response.get("hits", {}).get("hits", [])]
 
     async def list_notes(self, *, skip: int = 0, limit: int = 50) -> List[Note]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         response = await self.client.search(
             index=self._notes_index,
             size=limit,
@@ -671,44 +917,44 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         return [self._hit_to_note(hit) for hit in response.get("hits", {}).get("hits", [])]
 
     async def count_notes(self) -> int:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         response = await self.client.count(index=self._notes_index)
         return int(response.get("count", 0))
 
     async def get_stats(self) -> Dict[str, int]:
-        await self._ensure_indices()
-        total_notes = int((await self.client.count(index=self._notes_index)).get("count", 0))
-        total_versions = int((await self.client.count(index=self._versions_index)).get("count", 0))
-        approved_versions = int(
-            (await self.client.count(index=self._versions_index, query={"term": {"state": NoteState.APPROVED.value}})).get(
-                "count", 0
-            )
-        )
-        draft_versions = int(
-            (await self.client.count(index=self._versions_index, query={"term": {"state": NoteState.DRAFT.value}})).get(
-                "count", 0
-            )
-        )
-        needs_review_versions = int(
-            (
-                await self.client.count(
-                    index=self._versions_index,
-                    query={"term": {"state": NoteState.NEEDS_REVIEW.value}},
-                )
-            ).get("count", 0)
-        )
-
+        if not self._indices_ready:
+            await self._ensure_indices()
+        # One aggregation search covers every versions-index figure; the notes count runs alongside it.
         # `tags` and `created_by` are mapped as `keyword` types in the index mappings.
         # Use the field names directly for cardinality aggregation (no `.keyword` suffix).
-        agg_response = await self.client.search(
-            index=self._versions_index,
-            size=0,
-            aggs={
-                "distinct_tags": {"cardinality": {"field": "tags"}},
-                "active_authors": {"cardinality": {"field": "created_by"}},
-            },
+        notes_response, agg_response = await asyncio.gather(
+            self.client.count(index=self._notes_index),
+            self.client.search(
+                index=self._versions_index,
+                size=0,
+                track_total_hits=True,
+                aggs={
+                    "by_state": {
+                        "filters": {
+                            "filters": {
+                                state.value: {"term": {"state": state.value}}
+                                for state in (NoteState.APPROVED, NoteState.DRAFT, NoteState.NEEDS_REVIEW)
+                            }
+                        }
+                    },
+                    "distinct_tags": {"cardinality": {"field": "tags"}},
+                    "active_authors": {"cardinality": {"field": "created_by"}},
+                },
+            ),
         )
+        total_notes = int(notes_response.get("count", 0))
+        total_versions = int(agg_response.get("hits", {}).get("total", {}).get("value", 0))
         aggregations = agg_response.get("aggregations", {})
+        by_state = aggregations.get("by_state", {}).get("buckets", {})
+        approved_versions = int(by_state.get(NoteState.APPROVED.value, {}).get("doc_count", 0))
+        draft_versions = int(by_state.get(NoteState.DRAFT.value, {}).get("doc_count", 0))
+        needs_review_versions = int(by_state.get(NoteState.NEEDS_REVIEW.value, {}).get("doc_count", 0))
         distinct_tags = int(aggregations.get("distinct_tags", {}).get("value", 0))
         active_authors = int(aggregations.get("active_authors", {}).get("value", 0))
 
@@ -734,7 +980,8 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         reviewer_ids: Optional[List[str]] = None,
         review_type: Optional[str] = None,
     ) -> Review:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         review_id = uuid4().hex
         now = datetime.now(timezone.utc)
         review = Review(
@@ -767,46 +1014,87 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         return review
 
     async def update_review(self, review_id: str, updates: Dict[str, object]) -> Optional[Review]:
-        await self._ensure_indices()
-        current = await self.get_review(review_id)
-        if not current:
+        if not self._indices_ready:
+            await self._ensure_indices()
+        patch = self._review_patch_to_document(updates)
+        if "updated_at" not in patch:
+            patch["updated_at"] = _utcnow_iso()
+        try:
+            # Replace the patched top-level fields in place (a plain partial `doc` would merge
+            # `review_decisions` and keep trimmed entries) and get the result back in one call.
+            response = await self.client.update(
+                index=self._reviews_index,
+                id=review_id,
+                script={"source": _REPLACE_REVIEW_FIELDS_SCRIPT, "params": {"fields": patch}},
+                refresh="wait_for",
+                source=True,
+            )
+        except NotFoundError:
             return None
+        return self._hit_to_review({"_id": review_id, "_source": response["get"]["_source"]})
+
+    async def bulk_update_reviews(self, updates: Dict[str, Dict[str, object]]) -> int:
+        """Apply per-review field patches with bulk requests and return how many reviews were updated.
+
+        Reviews that no longer exist are skipped rather than failing the batch.
+        """
+        if not self._indices_ready:
+            await self._ensure_indices()
+        if not updates:
+            return 0
+        now = _utcnow_iso()
+        actions = (
+            {
+                "_op_type": "update",
+                "_index": self._reviews_index,
+                "_id": review_id,
+                "script": {
+                    "source": _REPLACE_REVIEW_FIELDS_SCRIPT,
+                    "params": {"fields": {"updated_at": now, **self._review_patch_to_document(review_updates)}},
+                },
+                "retry_on_conflict": 3,
+            }
+            for review_id, review_updates in updates.items()
+        )
+        updated, _failed = await async_bulk(
+            self.client,
+            actions,
+            max_chunk_bytes=_BULK_MAX_CHUNK_BYTES,
+            refresh="wait_for",
+            raise_on_error=False,
+            stats_only=True,
+        )
+        return updated
 
-        data = current.model_dump()
+    @staticmethod
+    def _review_patch_to_document(updates: Dict[str, object]) -> Dict[str, Any]:
+        """Convert a review update mapping into JSON-ready field values."""
+        patch: Dict[str, Any] = {}
         for key, value in updates.items():
-            if isinstance(value, ReviewStatus):
-                data[key] = value.value
-            elif key == "review_decisions" and isinstance(value, dict):
-                decisions: Dict[str, ReviewDecisionState] = {}
+            if key == "review_decisions" and isinstance(value, dict):
+                decisions: Dict[str, Any] = {}
                 for user_id, state in value.items():
-                    if isinstance(state, ReviewDecisionState):
-                        decisions[user_id] = state
-                    elif isinstance(state, dict):
-                        decisions[user_id] = ReviewDecisionState(
+                    if isinstance(state, dict):
+                        state = ReviewDecisionState(
                             decision=ReviewDecision(state.get("decision")),
                             comment=state.get("comment"),
                             updated_at=state.get("updated_at", datetime.now(timezone.utc)),
                         )
-                data[key] = decisions
-            elif isinstance(value, ReviewDecisionState):
-                data[key] = value
+                    decisions[user_id] = state.model_dump(mode="json")
+                patch[key] = decisions
+            elif isinstance(value, BaseModel):
+                patch[key] = value.model_dump(mode="json")
+            elif isinstance(value, Enum):
+                patch[key] = value.value
+            elif isinstance(value, datetime):
+                patch[key] = value.isoformat()
             else:
-                data[key] = value
-
-        if "updated_at" not in updates:
-            data["updated_at"] = datetime.now(timezone.utc)
-
-        updated = Review.model_validate(data)
-        await self.client.index(
-            index=self._reviews_index,
-            id=review_id,
-            document=self._review_to_document(updated),
-            refresh="wait_for",
-        )
-        return updated
+                patch[key] = value
+        return patch
 
     async def get_review(self, review_id: str) -> Optional[Review]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         try:
             doc = await self.client.get(index=self._reviews_index, id=review_id)
         except NotFoundError:
@@ -814,7 +1102,8 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         return self._hit_to_review(doc)
 
     async def get_review_by_version(self, draft_version_id: str) -> Optional[Review]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         response = await self.client.search(
             index=self._reviews_index,
             size=1,
@@ -826,14 +1115,18 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         return self._hit_to_review(hits[0])
 
     async def get_reviews_by_version_ids(self, version_ids: Iterable[str]) -> Dict[str, Review]:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         ids = [version_id for version_id in set(version_ids) if version_id]
         if not ids:
             return {}
+        # Pure lookup: filter context plus `_doc` order skips scoring and sorting entirely.
         response = await self.client.search(
             index=self._reviews_index,
             size=len(ids) * 2,
-            query={"terms": {"draft_version_id": ids}},
+            query={"bool": {"filter": [{"terms": {"draft_version_id": ids}}]}},
+            sort=["_doc"],
+            track_scores=False,
         )
         results: Dict[str, Review] = {}
         for hit in response.get("hits", {}).get("hits", []):
@@ -850,43 +1143,37 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         involved_user: Optional[str] = None,
         note_id: Optional[str] = None,
         limit: int = 100,
+        sort: bool = True,
     ) -> List[Review]:
-        await self._ensure_indices()
-        must_filters: List[Dict[str, Any]] = []
-        if status:
-            must_filters.append({"terms": {"status": [entry.value for entry in status]}})
+        """Reviews matching every given filter, newest update first.
+
+        Pass `sort=False` when order doesn't matter: `_doc` order avoids building the sorted queue.
+        An explicitly empty `status` list matches nothing; `None` leaves status unfiltered.
+        """
+        if status is not None and not status:
+            return []
+        if not self._indices_ready:
+            await self._ensure_indices()
+        # Everything here is exact-match: keep it in filter context (no scoring, cacheable).
+        filter_clauses: List[Dict[str, Any]] = []
+        if status and len(status) == 1:
+            filter_clauses.append({"term": {"status": status[0].value}})
+        elif status:
+            filter_clauses.append({"terms": {"status": [entry.value for entry in status]}})
         if created_by:
-            must_filters.append({"term": {"created_by": created_by}})
+            filter_clauses.append({"term": {"created_by": created_by}})
         if reviewer_id:
-            must_filters.append({"term": {"reviewer_ids": reviewer_id}})
+            filter_clauses.append({"term": {"reviewer_ids": reviewer_id}})
         if note_id:
-            must_filters.append({"term": {"note_id": note_id}})
-
-        query: Dict[str, Any]
+            filter_clauses.append({"term": {"note_id": note_id}})
         if involved_user:
-            involvement_filter = {
-                "bool": {
-                    "should": [
-                        {"term": {"created_by": involved_user}},
-                        {"term": {"reviewer_ids": involved_user}},
-                    ],
-                    "minimum_should_match": 1,
-                }
-            }
-            if must_filters:
-                query = {"bool": {"must": must_filters, "filter": [involvement_filter]}}
-            else:
-                query = involvement_filter
-        else:
-            if must_filters:
-                query = {"bool": {"must": must_filters}}
-            else:
-                query = {"match_all": {}}
+            filter_clauses.append({"term": {"involved_users": involved_user}})
+        query: Dict[str, Any] = {"bool": {"filter": filter_clauses}}
 
         response = await self.client.search(
             index=self._reviews_index,
             size=limit,
-            sort=[{"updated_at": {"order": "desc"}}],
+            sort=[{"updated_at": {"order": "desc"}}] if sort else ["_doc"],
             query=query,
         )
         return [self._hit_to_review(hit) for hit in response.get("hits", {}).get("hits", [])]
@@ -900,7 +1187,8 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         message: Optional[str] = None,
         metadata: Optional[Dict[str, object]] = None,
     ) -> ReviewEvent:
-        await self._ensure_indices()
+        if not self._indices_ready:
+            await self._ensure_indices()
         event_id = uuid4().hex
         event = ReviewEvent(
             _id=event_id,
@@ -911,6 +1199,7 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
             metadata=metadata or {},
             created_at=datetime.now(timezone.utc),
         )
+        # The review page refetches its timeline right after an action, so the event must be searchable
         await self.client.index(
             index=self._review_events_index,
             id=event_id,
@@ -919,12 +1208,70 @@ class ElasticsearchNotesRepository(NotesRepositoryProtocol):
         )
         return event
 
-    async def list_review_events(self, review_id: str, limit: int = 200) -> List[ReviewEvent]:
-        await self._ensure_indices()
+    async def add_review_events(self, events: Iterable[ReviewEvent]) -> List[ReviewEvent]:
+        """Append several events with bulk requests; events without an id get one assigned."""
+        if not self._indices_ready:
+            await self._ensure_indices()
+        stored = [event if event.id else event.model_copy(update={"id": uuid4().hex}) for event in events]
+        if not stored:
+            return []
+        actions = (
+            {
+                "_op_type": "index",
+                "_index": self._review_events_index,
+                "_id": event.id,
+                "_source": self._review_event_to_document(event),
+            }
+            for event in stored
+        )
+        await async_bulk(self.client, actions, max_chunk_bytes=_BULK_MAX_CHUNK_BYTES, refresh=False)
+        return stored
+
+    async def get_reviews_and_events(
+        self,
+        review_ids: Iterable[str],
+        events_limit: int = 200,
+    ) -> Tuple[Dict[str, Review], Dict[str, List[ReviewEvent]]]:
+        """Fetch reviews and their events (oldest first, at most `events_limit` per review).
+
+        The reviews mget and one events search per review are all sent concurrently; separate
+        searches keep one busy review from crowding out the others' events.
+        """
+        if not self._indices_ready:
+            await self._ensure_indices()
+        ids = list(dict.fromkeys(review_id for review_id in review_ids if review_id))
+        if not ids:
+            return {}, {}
+        reviews_response, *event_lists = await asyncio.gather(
+            self.client.mget(index=self._reviews_index, ids=ids),
+            *(self.list_review_events(review_id, limit=events_limit) for review_id in ids),
+        )
+        reviews: Dict[str, Review] = {}
+        for doc in reviews_response.get("docs", []):
+            if doc.get("found"):
+                reviews[doc["_id"]] = self._hit_to_review(doc)
+        events = {review_id: review_events for review_id, review_events in zip(ids, event_lists) if review_id in reviews}
+        return reviews, events
+
+    async def list_review_events(
+        self,
+        review_id: str,
+        limit: int = 200,
+        sort: bool = True,
+        since: Optional[datetime] = None,
+    ) -> List[ReviewEvent]:
+        """Events for a review, oldest first; `since` returns only events created after it."""
+        if not self._indices_ready:
+            await self._ensure_indices()
+        filter_clauses: List[Dict[str, Any]] = [{"term": {"review_id": review_id}}]
+        if since is not None:
+            filter_clauses.append({"range": {"created_at": {"gt": since.isoformat()}}})
         response = await self.client.search(
             index=self._review_events_index,
+            source_includes=_REVIEW_EVENT_SOURCE_INCLUDES,
             size=limit,
-            sort=[{"created_at": {"order": "asc"}}],
-            query={"term": {"review_id": review_id}},
+            sort=[{"created_at": {"order": "asc"}}] if sort else ["_doc"],
+            query={"bool": {"filter": filter_clauses}},
+            track_total_hits=False,
         )
         return [self._hit_to_review_event(hit) for hit in response.get("hits", {}).get("hits", [])]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Dict, Iterable, List, Optional, Protocol, Tuple
 
 from ..models import (
@@ -74,6 +75,9 @@ class NotesRepositoryProtocol(Protocol):
     async def get_notes_by_ids(self, note_ids: Iterable[str]) -> Dict[str, Note]:
         ...
 
+    async def get_note_deletion_markers(self, note_ids: Iterable[str]) -> Dict[str, Optional[datetime]]:
+        ...
+
     async def update_vote_counts(
         self,
         note_id: str,
@@ -97,6 +101,7 @@ class NotesRepositoryProtocol(Protocol):
         committed_by: Optional[str] = None,
         reviewed_by: Optional[str] = None,
         sort_by: Optional[str] = None,
+        facets: bool = True,
     ) -> Tuple[List[Tuple[NoteVersion, float]], int, Dict[str, List[str]]]:
         ...
 
@@ -135,6 +140,9 @@ class NotesRepositoryProtocol(Protocol):
     async def update_review(self, review_id: str, updates: Dict[str, object]) -> Optional[Review]:
         ...
 
+    async def bulk_update_reviews(self, updates: Dict[str, Dict[str, object]]) -> int:
+        ...
+
     async def get_review(self, review_id: str) -> Optional[Review]:
         ...
 
@@ -153,6 +161,7 @@ class NotesRepositoryProtocol(Protocol):
         involved_user: Optional[str] = None,
         note_id: Optional[str] = None,
         limit: int = 100,
+        sort: bool = True,
     ) -> List[Review]:
         ...
 
@@ -167,5 +176,21 @@ class NotesRepositoryProtocol(Protocol):
     ) -> ReviewEvent:
         ...
 
-    async def list_review_events(self, review_id: str, limit: int = 200) -> List[ReviewEvent]:
+    async def add_review_events(self, events: Iterable[ReviewEvent]) -> List[ReviewEvent]:
+        ...
+
+    async def get_reviews_and_events(
+        self,
+        review_ids: Iterable[str],
+        events_limit: int = 200,
+    ) -> Tuple[Dict[str, Review], Dict[str, List[ReviewEvent]]]:
+        ...
+
+    async def list_review_events(
+        self,
+        review_id: str,
+        limit: int = 200,
+        sort: bool = True,
+        since: Optional[datetime] = None,
+    ) -> List[ReviewEvent]:
         ...
@@ -2,15 +2,11 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
-import hashlib
-import hmac
-from datetime import datetime, timedelta, timezone
-
-import httpx
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
-from ..config import SaraswatiSettings, get_settings
+from ..config import SaraswatiSettings
+from ..dependencies import get_app_settings
 # import auth facade functions with aliases to avoid shadowing the route handler names
 from ..auth import login as auth_login, register as auth_register
 
@@ -23,12 +19,12 @@ class LoginRequest(BaseModel):
 
 
 @router.post("/login")
-async def login(payload: LoginRequest, settings: SaraswatiSettings = Depends(get_settings)) -> Dict[str, Any]:
+async def login(payload: LoginRequest, settings: SaraswatiSettings = Depends(get_app_settings)) -> Dict[str, Any]:
     return await auth_login(payload.username, payload.password, settings)
 
 
 @router.get("/capabilities")
-async def capabilities(settings: SaraswatiSettings = Depends(get_settings)) -> Dict[str, Any]:
+async def capabilities(settings: SaraswatiSettings = Depends(get_app_settings)) -> Dict[str, Any]:
     """Expose authentication capabilities to the frontend.
 
     - registration is allowed only when the backend is using Elasticsearch-backed auth (elastic)
@@ -47,11 +43,10 @@ class RegisterRequest(BaseModel):
 
 
 @router.post("/register")
-async def register(payload: RegisterRequest, settings: SaraswatiSettings = Depends(get_settings)) -> Dict[str, Any]:
+async def register(payload: RegisterRequest, settings: SaraswatiSettings = Depends(get_app_settings)) -> Dict[str, Any]:
     """Register a new user in Elasticsearch when backend allows registration.
 
-    This endpoint is intentionally minimal: it computes a SHA256 hex digest of the password
-    and stores it in `password_hash`. For production, replace this with a proper
-    password hashing algorithm (bcrypt/argon2) and admin approval flow.
+    This endpoint is intentionally minimal: it stores an argon2 hash of the password in
+    `password_hash`. For production, add an admin approval flow.
     """
     return await auth_register(payload.username.strip(), payload.password, payload.name, settings)
@@ -466,7 +466,8 @@ class NotesService:
                 return [], 0, facets
 
         note_ids = [version.note_id for version, _ in normalized_results]
-        notes_map = await self.repository.get_notes_by_ids(note_ids)
+        # Only the soft-delete marker is needed to filter hits
+        deletion_markers = await self.repository.get_note_deletion_markers(note_ids)
 
         seen_notes: set[str] = set()
         filtered: List[Tuple[NoteVersion, float]] = []
@@ -475,10 +476,9 @@ class NotesService:
             note_id = version.note_id
             if note_id in seen_notes:
                 continue
-            note = notes_map.get(note_id)
-            if not note:
+            if note_id not in deletion_markers:
                 continue
-            if note.deleted_at is not None and not allow_deleted and version.state != NoteState.DELETED:
+            if deletion_markers[note_id] is not None and not allow_deleted and version.state != NoteState.DELETED:
                 continue
             filtered.append((version, score))
             seen_notes.add(note_id)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timezone
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -24,6 +25,10 @@ from .notes import NotesService
 _ACTIVE_STATUSES = {ReviewStatus.OPEN, ReviewStatus.CHANGES_REQUESTED}
 
 
+async def _get_optional_version(repository: NotesRepositoryProtocol, version_id: Optional[str]) -> Optional[NoteVersion]:
+    return await repository.get_version(version_id) if version_id else None
+
+
 class ReviewsService:
     """Orchestrates the GitHub-style review workflow for Saraswati notes."""
 
@@ -439,25 +444,29 @@ class ReviewsService:
         )
 
     async def get_review_detail(self, review_id: str) -> Tuple[Review, NoteVersion, Optional[NoteVersion], List[ReviewEvent], Note]:
-        review = await self._require_review(review_id)
-        
+        reviews, events_map = await self.repository.get_reviews_and_events([review_id])
+        review = reviews.get(review_id)
+        if not review:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Review not found")
+        events = events_map.get(review_id, [])
+
+        # Versions and note metadata are independent lookups; fetch them concurrently.
+        base_lookup = _get_optional_version(self.repository, review.base_version_id)
+
         # Handle special reviews (empty draft_version_id). Use base version as the display version.
         if not review.draft_version_id:
-            base_version = await self.repository.get_version(review.base_version_id) if review.base_version_id else None
+            base_version, note = await asyncio.gather(base_lookup, self.notes_service.get_note_metadata(review.note_id))
             if not base_version:
                 raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Base version missing for special review")
-            note = await self.notes_service.get_note_metadata(review.note_id)
-            events = await self.repository.list_review_events(review_id)
             return review, base_version, None, events, note
-        
-        version = await self.repository.get_version(review.draft_version_id)
+
+        version, base_version, note = await asyncio.gather(
+            self.repository.get_version(review.draft_version_id),
+            base_lookup,
+            self.notes_service.get_note_metadata(review.note_id),
+        )
         if not version:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Draft version missing for review")
-        base_version: Optional[NoteVersion] = None
-        if review.base_version_id:
-            base_version = await self.repository.get_version(review.base_version_id)
-        note = await self.notes_service.get_note_metadata(review.note_id)
-        events = await self.repository.list_review_events(review_id)
         return review, version, base_version, events, note
 
     async def get_active_review_for_version(self, version_id: str) -> Optional[Review]:
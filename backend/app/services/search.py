@@ -1 +0,0 @@
-"""Legacy search helper module intentionally left blank."""
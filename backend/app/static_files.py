@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import hashlib
+from os import PathLike
+from pathlib import Path
+from typing import Any, Union
+
+from fastapi.responses import Response
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+
+
+class HashedAssetsStaticFiles(StaticFiles):
+    """Static files whose names carry a content hash (Vite output), so clients may cache them forever."""
+
+    async def get_response(self, path: str, scope) -> Response:  # type: ignore[override]
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
+class SPAStaticFiles(StaticFiles):
+    """Frontend build served by Starlette, with index.html as the fallback for client-side routes.
+
+    index.html never changes while the process runs, so it is read once and served from memory
+    with an ETag; every other file goes through the regular StaticFiles path.
+    """
+
+    def __init__(self, *, directory: Union[str, PathLike[str]], **kwargs: Any) -> None:
+        super().__init__(directory=directory, **kwargs)
+        index_path = Path(directory) / "index.html"
+        self._index_html = index_path.read_bytes() if index_path.is_file() else None
+        self._index_etag = f'"{hashlib.md5(self._index_html).hexdigest()}"' if self._index_html is not None else None
+
+    async def get_response(self, path: str, scope) -> Response:  # type: ignore[override]
+        # Only serve index.html for non-API routes
+        if path == "api" or path.startswith("api/"):
+            raise HTTPException(status_code=404, detail="API endpoint not found")
+        if path in ("", ".", "index.html"):
+            return self._index_response(scope)
+        try:
+            return await super().get_response(path, scope)
+        except HTTPException as exc:
+            if exc.status_code != 404:
+                raise
+            return self._index_response(scope)
+
+    def _index_response(self, scope) -> Response:
+        if self._index_html is None:
+            raise HTTPException(status_code=404, detail="Frontend build missing")
+        # index.html is not content-hashed; always revalidate (cheap 304 via ETag)
+        headers = {"ETag": self._index_etag, "Cache-Control": "no-cache"}
+        if self._index_etag in Headers(scope=scope).get("if-none-match", ""):
+            return Response(status_code=304, headers=headers)
+        return Response(content=self._index_html, media_type="text/html", headers=headers)
@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import hashlib
 import itertools
-from datetime import datetime, timezone
-from typing import Dict, Iterable, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+import httpx
 import pytest
+from cachetools import TTLCache
+from fastapi import HTTPException
 
-from app.config import EmbeddingConfig, ElasticsearchConfig, ExternalAuthConfig, SaraswatiSettings
+from app import auth, auth_external, auth_native, hooks
+from app.repositories import elastic
+from app.repositories.elastic import ElasticsearchNotesRepository
+from app.config import EmbeddingConfig, ElasticsearchConfig, ExternalAuthConfig, NativeAuthConfig, SaraswatiSettings
 from app.models import (
     Note,
     NoteState,
@@ -19,6 +29,7 @@ from app.models import (
     ReviewStatus,
 )
 from app.services.notes import NotesService
+from app.services.reviews import ReviewsService
 
 
 def _now() -> datetime:
@@ -185,6 +196,9 @@ class FakeNotesRepository:
     async def get_notes_by_ids(self, note_ids: Iterable[str]) -> Dict[str, Note]:
         return {note_id: self._notes[note_id] for note_id in note_ids if note_id in self._notes}
 
+    async def get_note_deletion_markers(self, note_ids: Iterable[str]) -> Dict[str, Optional[datetime]]:
+        return {note_id: self._notes[note_id].deleted_at for note_id in note_ids if note_id in self._notes}
+
     async def update_vote_counts(
         self,
         note_id: str,
@@ -425,6 +439,10 @@ class FakeNotesRepository:
         self._reviews[review_id] = updated
         return updated
 
+    async def bulk_update_reviews(self, updates: Dict[str, Dict[str, object]]) -> int:
+        updated = [await self.update_review(review_id, review_updates) for review_id, review_updates in updates.items()]
+        return sum(1 for review in updated if review)
+
     async def get_review(self, review_id: str) -> Optional[Review]:
         return self._reviews.get(review_id)
 
@@ -447,7 +465,10 @@ class FakeNotesRepository:
         involved_user: Optional[str] = None,
         note_id: Optional[str] = None,
         limit: int = 100,
+        sort: bool = True,
     ) -> List[Review]:
+        if status is not None and not status:
+            return []
         statuses = {s.value for s in (status or [])}
         results: List[Review] = []
         for review in self._reviews.values():
@@ -462,7 +483,8 @@ class FakeNotesRepository:
             if involved_user and involved_user not in {review.created_by, *review.reviewer_ids}:
                 continue
             results.append(review)
-        results.sort(key=lambda review: review.updated_at, reverse=True)
+        if sort:
+            results.sort(key=lambda review: review.updated_at, reverse=True)
         return results[:limit]
 
     async def add_review_event(
@@ -487,8 +509,62 @@ class FakeNotesRepository:
         self._review_events.setdefault(review_id, []).append(event)
         return event
 
-    async def list_review_events(self, review_id: str, limit: int = 200) -> List[ReviewEvent]:
-        return self._review_events.get(review_id, [])[:limit]
+    async def add_review_events(self, events: Iterable[ReviewEvent]) -> List[ReviewEvent]:
+        stored = [event if event.id else event.model_copy(update={"id": str(next(self._event_counter))}) for event in events]
+        for event in stored:
+            self._review_events.setdefault(event.review_id, []).append(event)
+        return stored
+
+    async def get_reviews_and_events(
+        self,
+        review_ids: Iterable[str],
+        events_limit: int = 200,
+    ) -> Tuple[Dict[str, Review], Dict[str, List[ReviewEvent]]]:
+        reviews = {review_id: self._reviews[review_id] for review_id in review_ids if review_id in self._reviews}
+        return reviews, {review_id: self._review_events.get(review_id, [])[:events_limit] for review_id in reviews}
+
+    async def list_review_events(
+        self,
+        review_id: str,
+        limit: int = 200,
+        sort: bool = True,
+        since: Optional[datetime] = None,
+    ) -> List[ReviewEvent]:
+        events = self._review_events.get(review_id, [])
+        if since is not None:
+            events = [event for event in events if event.created_at > since]
+        return events[:limit]
+
+
+class RecordingElasticsearch:
+    """Stands in for AsyncElasticsearch: records every call and replies with canned responses.
+
+    `responses` maps a method name ("search", "indices.get", ...) to a response dict or to a
+    callable that receives the call's kwargs.
+    """
+
+    def __init__(self, responses: Optional[Dict[str, Any]] = None) -> None:
+        self.calls: List[Tuple[str, Dict[str, Any]]] = []
+        self.responses: Dict[str, Any] = dict(responses or {})
+        self.indices = SimpleNamespace(
+            **{name: self._recorder(f"indices.{name}") for name in ("get", "create", "exists", "put_mapping")}
+        )
+
+    def _recorder(self, name: str):
+        async def call(**kwargs: Any) -> Any:
+            self.calls.append((name, kwargs))
+            reply = self.responses.get(name, {})
+            return reply(**kwargs) if callable(reply) else reply
+
+        return call
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return self._recorder(name)
+
+    def calls_to(self, name: str) -> List[Dict[str, Any]]:
+        return [kwargs for called, kwargs in self.calls if called == name]
 
 
 @pytest.fixture()
@@ -511,6 +587,38 @@ def settings() -> SaraswatiSettings:
     )
 
 
+@pytest.fixture()
+def es_client(settings: SaraswatiSettings, monkeypatch: pytest.MonkeyPatch) -> RecordingElasticsearch:
+    # Every index already exists (and is migrated) unless a test says otherwise
+    monkeypatch.setattr(elastic, "_READY_INDEX_SETS", set())
+    monkeypatch.setattr(elastic, "_INDEX_SETUP_LOCKS", {})
+    cfg = settings.elasticsearch
+    existing = {
+        name: {"aliases": {}, "mappings": {"_meta": {elastic._INVOLVED_USERS_META: True}}}
+        for name in (cfg.notes_index, cfg.versions_index, cfg.reviews_index, cfg.review_events_index)
+    }
+    return RecordingElasticsearch({"indices.get": existing})
+
+
+@pytest.fixture()
+def bulk_actions(monkeypatch: pytest.MonkeyPatch) -> List[Dict[str, Any]]:
+    """Capture the actions the repository hands to `async_bulk`."""
+    captured: List[Dict[str, Any]] = []
+
+    async def fake_async_bulk(client, actions, **kwargs):
+        batch = list(actions)
+        captured.extend(batch)
+        return (len(batch), 0) if kwargs.get("stats_only") else (len(batch), [])
+
+    monkeypatch.setattr(elastic, "async_bulk", fake_async_bulk)
+    return captured
+
+
+@pytest.fixture()
+def elastic_repository(es_client: RecordingElasticsearch, settings: SaraswatiSettings) -> ElasticsearchNotesRepository:
+    return ElasticsearchNotesRepository(es_client, settings)
+
+
 @pytest.fixture()
 def service(settings: SaraswatiSettings, monkeypatch: pytest.MonkeyPatch) -> NotesService:
     repository = FakeNotesRepository()
@@ -683,3 +791,473 @@ async def test_discard_draft(service: NotesService) -> None:
     detail_note, display_version = await service.get_note_detail(note.id)
     assert detail_note.current_version_id == approved.id
     assert display_version.id == approved.id
+
+
+def test_native_jwt_secret_is_required(settings: SaraswatiSettings) -> None:
+    # An empty HMAC key would let anyone mint tokens, so a missing secret must fail closed
+    with pytest.raises(ValueError):
+        NativeAuthConfig().jwt_secret_bytes
+    with pytest.raises(ValueError):
+        NativeAuthConfig(jwt_secret="").jwt_secret_bytes
+    assert NativeAuthConfig(jwt_secret="s3cret").jwt_secret_bytes == b"s3cret"
+
+    with pytest.raises(ValueError):
+        SaraswatiSettings(**{**settings.model_dump(), "auth_system": "elastic", "auth_native": {}})
+
+
+@pytest.mark.asyncio
+async def test_unusable_vectors_are_left_out_of_documents(
+    elastic_repository: ElasticsearchNotesRepository,
+    es_client: RecordingElasticsearch,
+    bulk_actions: List[Dict[str, Any]],
+) -> None:
+    assert ElasticsearchNotesRepository._normalize_vector([]) is None
+    assert ElasticsearchNotesRepository._normalize_vector([0.0, 0.0]) is None
+    assert ElasticsearchNotesRepository._normalize_vector([3.0, 4.0]) == pytest.approx([0.6, 0.8])
+
+    # An embedding timeout yields []; the note must still be stored, just without a vector
+    _, version = await elastic_repository.create_note_with_version("Title", "Body", ["tag"], "rory", vector=[])
+    assert version.vector is None
+    version_doc = next(action["_source"] for action in bulk_actions if action["_id"] == version.id)
+    assert "vector" not in version_doc
+
+    # ...and a zero query vector falls back to a plain keyword search instead of an invalid knn
+    es_client.responses["search"] = {"hits": {"hits": [], "total": {"value": 0}}}
+    await elastic_repository.hybrid_search(keyword="body", vector=[0.0, 0.0], limit=5)
+    assert "knn" not in es_client.calls_to("search")[-1]
+
+
+@pytest.mark.asyncio
+async def test_review_events_since(
+    elastic_repository: ElasticsearchNotesRepository,
+    es_client: RecordingElasticsearch,
+) -> None:
+    since = _now()
+    es_client.responses["search"] = {
+        "hits": {
+            "hits": [
+                {
+                    "_id": "event-2",
+                    "_source": {
+                        "review_id": "review-1",
+                        "event_type": "comment",
+                        "author_id": "liam",
+                        "created_at": (since + timedelta(seconds=1)).isoformat(),
+                    },
+                }
+            ]
+        }
+    }
+
+    events = await elastic_repository.list_review_events("review-1", since=since)
+
+    assert [(event.id, event.event_type) for event in events] == [("event-2", ReviewEventType.COMMENT)]
+    request = es_client.calls_to("search")[-1]
+    assert request["query"] == {
+        "bool": {
+            "filter": [
+                {"term": {"review_id": "review-1"}},
+                {"range": {"created_at": {"gt": since.isoformat()}}},
+            ]
+        }
+    }
+    assert request["sort"] == [{"created_at": {"order": "asc"}}]
+    assert request["track_total_hits"] is False
+
+    # Without `since` the whole history is requested
+    await elastic_repository.list_review_events("review-1")
+    assert es_client.calls_to("search")[-1]["query"] == {"bool": {"filter": [{"term": {"review_id": "review-1"}}]}}
+
+
+@pytest.mark.asyncio
+async def test_list_reviews_empty_status_matches_nothing(
+    elastic_repository: ElasticsearchNotesRepository,
+    es_client: RecordingElasticsearch,
+) -> None:
+    es_client.responses["search"] = {"hits": {"hits": []}}
+
+    assert await elastic_repository.list_reviews(status=[]) == []
+    assert es_client.calls_to("search") == []
+
+    await elastic_repository.list_reviews(status=None)
+    assert es_client.calls_to("search")[-1]["query"] == {"bool": {"filter": []}}
+
+    await elastic_repository.list_reviews(status=[ReviewStatus.OPEN])
+    assert es_client.calls_to("search")[-1]["query"] == {"bool": {"filter": [{"term": {"status": "open"}}]}}
+
+    await elastic_repository.list_reviews(status=[ReviewStatus.OPEN, ReviewStatus.MERGED])
+    assert es_client.calls_to("search")[-1]["query"] == {
+        "bool": {"filter": [{"terms": {"status": ["open", "merged"]}}]}
+    }
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_reviews(
+    elastic_repository: ElasticsearchNotesRepository,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    captured: Dict[str, Any] = {}
+
+    async def fake_async_bulk(client, actions, **kwargs):
+        captured["actions"] = list(actions)
+        captured["kwargs"] = kwargs
+        # The third review is gone: its update fails with a 404 and is counted, not raised
+        return len(captured["actions"]) - 1, 1
+
+    monkeypatch.setattr(elastic, "async_bulk", fake_async_bulk)
+
+    assert await elastic_repository.bulk_update_reviews({}) == 0
+    assert "actions" not in captured
+
+    updated = await elastic_repository.bulk_update_reviews(
+        {
+            "review-1": {"status": ReviewStatus.CLOSED},
+            "review-2": {"status": ReviewStatus.CLOSED, "reviewer_ids": ["olga"]},
+            "missing-review": {"status": ReviewStatus.CLOSED},
+        }
+    )
+
+    assert updated == 2
+    assert captured["kwargs"]["stats_only"] is True
+    assert captured["kwargs"]["raise_on_error"] is False
+    actions = {action["_id"]: action for action in captured["actions"]}
+    assert set(actions) == {"review-1", "review-2", "missing-review"}
+    for action in actions.values():
+        assert action["_op_type"] == "update"
+        assert action["_index"] == "note_reviews"
+        assert action["retry_on_conflict"] == 3
+        assert action["script"]["source"] == elastic._REPLACE_REVIEW_FIELDS_SCRIPT
+    fields = actions["review-2"]["script"]["params"]["fields"]
+    assert fields["status"] == "closed"
+    assert fields["reviewer_ids"] == ["olga"]
+    assert "updated_at" in fields
+
+
+@pytest.mark.asyncio
+async def test_introspection_is_coalesced_and_survives_caller_cancellation(
+    settings: SaraswatiSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    calls = 0
+    release = asyncio.Event()
+
+    async def fake_remote(token: str, _: SaraswatiSettings):
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return {"active": True, "sub": "pat"}
+
+    monkeypatch.setattr(auth_external, "_introspect_remote", fake_remote)
+    monkeypatch.setattr(auth_external, "_cache", TTLCache(maxsize=16, ttl=60))
+    monkeypatch.setattr(auth_external, "_inflight", {})
+
+    owner = asyncio.create_task(auth_external.introspect_external("opaque-token", settings))
+    waiter = asyncio.create_task(auth_external.introspect_external("opaque-token", settings))
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    # The first caller's request goes away; the coalesced one must still get its answer
+    owner.cancel()
+    release.set()
+
+    assert (await waiter)["sub"] == "pat"
+    with pytest.raises(asyncio.CancelledError):
+        await owner
+    assert calls == 1
+    assert auth_external._inflight == {}
+
+    # The shared result was cached, so a later call doesn't go remote again
+    assert (await auth_external.introspect_external("opaque-token", settings))["sub"] == "pat"
+    assert calls == 1
+
+
+@pytest.mark.asyncio
+async def test_basic_auth_caches_only_credential_rejections(
+    settings: SaraswatiSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    attempts: List[int] = []
+    outcomes = iter((502, 401))
+
+    async def fake_login(username: str, password: str, _: SaraswatiSettings):
+        status_code = next(outcomes)
+        attempts.append(status_code)
+        raise HTTPException(status_code=status_code, detail="login failed")
+
+    monkeypatch.setattr(auth, "login", fake_login)
+    monkeypatch.setattr(auth, "_failed_basic", TTLCache(maxsize=16, ttl=30))
+    header = "Basic " + base64.b64encode(b"quinn:secret").decode("ascii")
+    request = SimpleNamespace(headers={"authorization": header})
+
+    # A provider error is surfaced as-is and not remembered
+    with pytest.raises(HTTPException) as outage:
+        await auth.get_current_user(credentials=None, settings=settings, request=request)
+    assert outage.value.status_code == 502
+
+    # A real rejection is remembered, so the next attempt doesn't call login again
+    for _ in range(2):
+        with pytest.raises(HTTPException) as rejected:
+            await auth.get_current_user(credentials=None, settings=settings, request=request)
+        assert rejected.value.status_code == 401
+    assert attempts == [502, 401]
+
+
+def test_webhook_workers_restart_on_new_loop_and_drain(monkeypatch: pytest.MonkeyPatch) -> None:
+    delivered: List[Tuple[str, bytes]] = []
+
+    async def fake_post(hook, event_name: str, body: bytes) -> None:
+        await asyncio.sleep(0.01)
+        delivered.append((event_name, body))
+
+    monkeypatch.setattr(hooks, "_post", fake_post)
+
+    async def notify_then_stop(event_name: str) -> None:
+        hooks._enqueue(event_name, b"{}", (SimpleNamespace(url="http://hooks.local"),))
+        # Shutdown drains what is queued before cancelling the workers
+        await hooks.stop_webhook_workers()
+
+    # Each asyncio.run is a fresh loop, like a reload or a second TestClient
+    asyncio.run(notify_then_stop("first"))
+    asyncio.run(notify_then_stop("second"))
+
+    assert delivered == [("first", b"{}"), ("second", b"{}")]
+
+
+@pytest.mark.asyncio
+async def test_version_scan_pages_past_the_first_search(
+    elastic_repository: ElasticsearchNotesRepository,
+    es_client: RecordingElasticsearch,
+) -> None:
+    def version_hit(index: int) -> Dict[str, Any]:
+        source = {
+            "note_id": "note-1",
+            "version_index": index,
+            "title": "Title",
+            "content": "Body",
+            "tags": [],
+            "state": "approved",
+            "created_by": "rory",
+            "created_at": _now().isoformat(),
+        }
+        return {"_id": f"version-{index}", "_source": source, "sort": [index]}
+
+    pages = {None: [version_hit(1), version_hit(2)], (2,): [version_hit(3), version_hit(4)], (4,): [version_hit(5)]}
+
+    def search(**kwargs: Any) -> Dict[str, Any]:
+        if "pit" not in kwargs:
+            # A full first page means there may be more: the repository restarts inside a PIT
+            return {"hits": {"hits": pages[None]}}
+        after = kwargs.get("search_after")
+        return {"pit_id": "pit-2", "hits": {"hits": pages[tuple(after) if after else None]}}
+
+    es_client.responses["search"] = search
+    es_client.responses["open_point_in_time"] = {"id": "pit-1"}
+
+    versions = [
+        version
+        async for version in elastic_repository._iter_versions(
+            {"term": {"note_id": "note-1"}}, [{"version_index": {"order": "asc"}}], page_size=2
+        )
+    ]
+
+    assert [version.version_index for version in versions] == [1, 2, 3, 4, 5]
+    searches = es_client.calls_to("search")
+    assert [request.get("search_after") for request in searches[1:]] == [None, [2], [4]]
+    assert searches[1]["pit"]["id"] == "pit-1"
+    assert searches[2]["pit"]["id"] == "pit-2"
+    assert es_client.calls_to("close_point_in_time") == [{"id": "pit-2"}]
+
+
+@pytest.mark.asyncio
+async def test_update_review_replaces_fields_with_a_script(
+    elastic_repository: ElasticsearchNotesRepository,
+    es_client: RecordingElasticsearch,
+) -> None:
+    stored = {
+        "note_id": "note-1",
+        "draft_version_id": "version-2",
+        "title": "Review me",
+        "created_by": "kate",
+        "reviewer_ids": ["liam"],
+        "status": "open",
+        "review_decisions": {"liam": {"decision": "approved", "updated_at": _now().isoformat()}},
+        "involved_users": ["kate", "liam"],
+    }
+    es_client.responses["update"] = {"get": {"_source": stored}}
+
+    # A decision map that drops an entry must replace the field, not merge into it
+    review = await elastic_repository.update_review("review-1", {"review_decisions": {}, "status": ReviewStatus.OPEN})
+
+    request = es_client.calls_to("update")[-1]
+    assert request["id"] == "review-1"
+    assert request["source"] is True
+    assert "doc" not in request
+    assert request["script"]["source"] == elastic._REPLACE_REVIEW_FIELDS_SCRIPT
+    fields = request["script"]["params"]["fields"]
+    assert fields["review_decisions"] == {}
+    assert fields["status"] == "open"
+    assert "updated_at" in fields
+    # The updated review comes back from the same call rather than a follow-up GET
+    assert es_client.calls_to("get") == []
+    assert review is not None and review.id == "review-1"
+    assert review.reviewer_ids == ["liam"]
+
+
+@pytest.mark.asyncio
+async def test_involved_users_backfill_runs_once_per_index(
+    elastic_repository: ElasticsearchNotesRepository,
+    es_client: RecordingElasticsearch,
+    settings: SaraswatiSettings,
+) -> None:
+    # A reviews index created before `involved_users` existed carries no migration marker
+    reviews_index = settings.elasticsearch.reviews_index
+    es_client.responses["indices.get"][reviews_index]["mappings"]["_meta"] = {"owner": "ops"}
+    es_client.responses["search"] = {"hits": {"hits": []}}
+
+    await elastic_repository.list_reviews(involved_user="kate")
+
+    assert es_client.calls_to("indices.create") == []
+    mapping_updates = es_client.calls_to("indices.put_mapping")
+    assert mapping_updates[0] == {"index": reviews_index, "properties": {"involved_users": {"type": "keyword"}}}
+    (backfill,) = es_client.calls_to("update_by_query")
+    assert backfill["index"] == reviews_index
+    assert backfill["query"] == {"bool": {"must_not": [{"exists": {"field": "involved_users"}}]}}
+    assert backfill["script"] == {"source": elastic._INVOLVED_USERS_SCRIPT}
+    # The marker is written last, next to whatever _meta was already there
+    assert mapping_updates[-1] == {"index": reviews_index, "meta": {"owner": "ops", elastic._INVOLVED_USERS_META: True}}
+
+    # Setup is remembered for the index set, so another repository doesn't check again
+    await ElasticsearchNotesRepository(es_client, settings).list_reviews(involved_user="kate")
+    assert len(es_client.calls_to("indices.get")) == 1
+    assert len(es_client.calls_to("update_by_query")) == 1
+
+
+@pytest.mark.asyncio
+async def test_involved_users_backfill_skipped_when_marked(
+    elastic_repository: ElasticsearchNotesRepository,
+    es_client: RecordingElasticsearch,
+) -> None:
+    es_client.responses["search"] = {"hits": {"hits": []}}
+
+    await elastic_repository.list_reviews(involved_user="kate")
+
+    assert es_client.calls_to("update_by_query") == []
+    assert es_client.calls_to("indices.put_mapping") == []
+    assert es_client.calls_to("search")[-1]["query"] == {"bool": {"filter": [{"term": {"involved_users": "kate"}}]}}
+
+
+@pytest.mark.asyncio
+async def test_version_counter_seed_never_hands_out_duplicates(
+    elastic_repository: ElasticsearchNotesRepository,
+    es_client: RecordingElasticsearch,
+) -> None:
+    # A note written before the counter existed; its latest version is index 3
+    note = {"next_version_index": None}
+
+    def update(**kwargs: Any) -> Dict[str, Any]:
+        # Mirrors the painless scripts on a single document, which ES applies one at a time
+        script, params = kwargs["script"]["source"], kwargs["script"]["params"]
+        current = note["next_version_index"]
+        if script == elastic._NEXT_VERSION_INDEX_SCRIPT:
+            if current is None:
+                return {"result": "noop"}
+            note["next_version_index"] = max(current, params["floor"]) + 1
+        else:
+            assert script == elastic._SEED_VERSION_INDEX_SCRIPT
+            note["next_version_index"] = max(current or 0, params["next"]) + 1
+        return {"result": "updated", "get": {"_source": dict(note)}}
+
+    es_client.responses["update"] = update
+    es_client.responses["search"] = {"hits": {"hits": [{"_id": "version-3", "sort": [3]}]}}
+
+    # Both writers miss the counter and read the same latest version before either seeds it
+    allocated = await asyncio.gather(
+        elastic_repository._allocate_version_index("note-1", 1),
+        elastic_repository._allocate_version_index("note-1", 1),
+    )
+
+    assert sorted(allocated) == [4, 5]
+    assert note["next_version_index"] == 6
+    # Once seeded, allocation is a single scripted update
+    searches = len(es_client.calls_to("search"))
+    assert await elastic_repository._allocate_version_index("note-1", 1) == 6
+    assert len(es_client.calls_to("search")) == searches
+
+
+@pytest.mark.asyncio
+async def test_index_setup_recognises_aliases(
+    elastic_repository: ElasticsearchNotesRepository,
+    es_client: RecordingElasticsearch,
+    settings: SaraswatiSettings,
+) -> None:
+    # `indices.get` keys its response by concrete index, listing aliases underneath
+    existing = es_client.responses["indices.get"]
+    existing["notes-000002"] = {"aliases": {settings.elasticsearch.notes_index: {}}, "mappings": {}}
+    del existing[settings.elasticsearch.notes_index]
+    del existing[settings.elasticsearch.review_events_index]
+    es_client.responses["search"] = {"hits": {"hits": []}}
+
+    await elastic_repository.list_reviews()
+
+    assert [call["index"] for call in es_client.calls_to("indices.create")] == [
+        settings.elasticsearch.review_events_index
+    ]
+
+
+@pytest.mark.asyncio
+async def test_legacy_password_hash_is_upgraded_on_login(
+    settings: SaraswatiSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    settings = settings.model_copy(update={"auth_native": NativeAuthConfig(jwt_secret="s3cret")})
+    legacy_hash = hashlib.sha256(b"hunter2").hexdigest()
+    users = RecordingElasticsearch(
+        {"search": {"hits": {"hits": [{"_id": "user-1", "_source": {"username": "sam", "password_hash": legacy_hash}}]}}}
+    )
+    monkeypatch.setattr(auth_native, "get_elasticsearch_client", lambda _: users)
+    monkeypatch.setattr(auth_native, "_user_cache", TTLCache(maxsize=16, ttl=60))
+    monkeypatch.setattr(auth_native, "_verified_logins", TTLCache(maxsize=16, ttl=60))
+
+    result = await auth_native.login_native("sam", "hunter2", settings)
+
+    assert result["user"]["username"] == "sam"
+    (upgrade,) = users.calls_to("update")
+    assert upgrade["index"] == "users"
+    assert upgrade["id"] == "user-1"
+    new_hash = upgrade["doc"]["password_hash"]
+    assert new_hash.startswith("$argon2")
+    assert auth_native._verify_password(new_hash, "hunter2")
+    assert auth_native._user_cache["sam"][1] == new_hash
+
+    # An argon2 account is left alone
+    users.responses["search"]["hits"]["hits"][0]["_source"]["password_hash"] = new_hash
+    auth_native._user_cache.clear()
+    auth_native._verified_logins.clear()
+    await auth_native.login_native("sam", "hunter2", settings)
+    assert len(users.calls_to("update")) == 1
+
+
+@pytest.mark.asyncio
+async def test_introspection_outage_is_a_bad_gateway_and_not_shared(
+    settings: SaraswatiSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    replies: List[Any] = [httpx.ConnectError("auth service down"), httpx.Response(503), httpx.Response(200, json={"active": True, "sub": "pat"})]
+
+    class FlakyClient:
+        async def post(self, path: str, **kwargs: Any) -> httpx.Response:
+            reply = replies.pop(0)
+            if isinstance(reply, Exception):
+                raise reply
+            return reply
+
+    monkeypatch.setattr(auth_external, "get_client", lambda _: FlakyClient())
+    monkeypatch.setattr(auth_external, "_cache", TTLCache(maxsize=16, ttl=60))
+    monkeypatch.setattr(auth_external, "_inflight", {})
+
+    # Transport errors and provider 5xx are outages, not invalid tokens
+    for _ in range(2):
+        with pytest.raises(HTTPException) as outage:
+            await auth_external.introspect_external("opaque-token", settings)
+        assert outage.value.status_code == 502
+        # The failed request is not left behind for the next caller to inherit
+        assert auth_external._inflight == {}
+
+    assert (await auth_external.introspect_external("opaque-token", settings))["sub"] == "pat"
+    assert replies == []